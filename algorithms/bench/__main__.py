@@ -0,0 +1,59 @@
+import argparse
+import sys
+
+from algorithms.bench.compare import compare_results, format_comparisons
+from algorithms.bench.generators import geometric_sizes
+from algorithms.bench.runner import (BENCHMARK_CASES, BenchmarkResult, load_results, run_benchmarks, save_results,
+                                     scaling_exponents)
+
+
+def _print_result(result: BenchmarkResult):
+    print(f"{result.algorithm:<10} {result.size:>9} {result.wall_time_seconds:>10.4f}s "
+          f"{result.nodes_expanded:>10} expanded {result.peak_memory_bytes / 2 ** 20:>9.2f} MiB peak "
+          f"{result.history_bytes / 2 ** 10:>10.1f} KiB history", flush=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m algorithms.bench',
+                                     description="Benchmark the graph algorithms over geometrically growing inputs")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="run the benchmarks and write a JSON results file")
+    run_parser.add_argument('--algorithms', nargs='+', default=list(BENCHMARK_CASES), choices=list(BENCHMARK_CASES))
+    run_parser.add_argument('--min-size', type=int, default=1000)
+    run_parser.add_argument('--max-size', type=int, default=64000)
+    run_parser.add_argument('--factor', type=float, default=4.0)
+    run_parser.add_argument('--repeat', type=int, default=3)
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--output', default='bench_results.json')
+
+    compare_parser = commands.add_parser('compare', help="compare two results files, exit 1 on regressions")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('candidate')
+    compare_parser.add_argument('--threshold', type=float, default=0.1,
+                                help="allowed relative increase of time and memory, default 0.1")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        if args.repeat < 1:
+            run_parser.error("--repeat must be at least 1")
+        sizes = geometric_sizes(min_size=args.min_size, max_size=args.max_size, factor=args.factor)
+        results = run_benchmarks(algorithms=args.algorithms, sizes=sizes, seed=args.seed, repeat=args.repeat,
+                                 progress_callback=_print_result)
+        save_results(results=results, path=args.output)
+        for algorithm, exponent in scaling_exponents(results).items():
+            print(f"{algorithm:<10} wall time grows as size^{exponent:.2f}")
+        print(f"Wrote {len(results)} results to {args.output}")
+        return 0
+
+    comparisons = compare_results(baseline=load_results(args.baseline), candidate=load_results(args.candidate),
+                                  threshold=args.threshold)
+    print(format_comparisons(comparisons))
+    num_regressions = sum(comparison.is_regression for comparison in comparisons)
+    print(f"{num_regressions} regression(s) out of {len(comparisons)} compared metrics")
+    return 1 if num_regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
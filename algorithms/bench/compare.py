@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from typing import List
+
+from algorithms.bench.runner import BenchmarkResult
+
+COMPARED_METRICS = ('wall_time_seconds', 'peak_memory_bytes', 'nodes_expanded', 'history_bytes')
+
+
+@dataclass
+class MetricComparison:
+    algorithm: str
+    size: int
+    metric: str
+    baseline: float
+    candidate: float
+    is_regression: bool
+
+    @property
+    def ratio(self) -> float:
+        return self.candidate / self.baseline if self.baseline else float('inf') if self.candidate else 1.0
+
+
+def compare_results(baseline: List[BenchmarkResult], candidate: List[BenchmarkResult],
+                    threshold: float = 0.1) -> List[MetricComparison]:
+    # Only (algorithm, size) pairs present in both runs are compared. A metric regresses when the candidate is
+    # more than threshold (relative) above the baseline; counts such as nodes_expanded are exact, so any
+    # increase there is reported.
+    baseline_by_key = {(result.algorithm, result.size): result for result in baseline}
+
+    comparisons = []
+    for result in candidate:
+        reference = baseline_by_key.get((result.algorithm, result.size))
+        if reference is None:
+            continue
+
+        for metric in COMPARED_METRICS:
+            baseline_value, candidate_value = getattr(reference, metric), getattr(result, metric)
+            allowed = baseline_value * (1 + threshold) if metric.endswith(('_seconds', '_bytes')) else baseline_value
+            comparisons.append(MetricComparison(algorithm=result.algorithm, size=result.size, metric=metric,
+                                                baseline=baseline_value, candidate=candidate_value,
+                                                is_regression=candidate_value > allowed))
+    return comparisons
+
+
+def format_comparisons(comparisons: List[MetricComparison]) -> str:
+    lines = [f"{'algorithm':<10} {'size':>9} {'metric':<18} {'baseline':>14} {'candidate':>14} {'ratio':>7}"]
+    for comparison in comparisons:
+        marker = '  REGRESSION' if comparison.is_regression else ''
+        lines.append(f"{comparison.algorithm:<10} {comparison.size:>9} {comparison.metric:<18} "
+                     f"{comparison.baseline:>14.6g} {comparison.candidate:>14.6g} {comparison.ratio:>7.2f}{marker}")
+    return '\n'.join(lines)
@@ -0,0 +1,53 @@
+from typing import List
+
+import networkx as nx
+import numpy as np
+
+from algorithms.graph.utils import GridCellType
+
+
+def geometric_sizes(min_size: int, max_size: int, factor: float = 2.0) -> List[int]:
+    if min_size < 1 or factor <= 1:
+        raise ValueError("min_size must be at least 1 and factor greater than 1")
+
+    sizes = []
+    size = float(min_size)
+    while round(size) <= max_size:
+        sizes.append(int(round(size)))
+        size *= factor
+    return sizes
+
+
+def random_maze(num_cells: int, seed: int = 0, block_ratio: float = 0.2,
+                obstacle_ratio: float = 0.1) -> List[List[GridCellType]]:
+    # Square-ish maze of about num_cells cells, START in the top left corner and END in the bottom right one
+    side = max(2, int(round(np.sqrt(num_cells))))
+    rng = np.random.default_rng(seed)
+    cell_types = np.array([GridCellType.OPEN_PATH, GridCellType.BLOCK, GridCellType.OBSTACLE], dtype=object)
+    choices = rng.choice(3, size=(side, side), p=[1 - block_ratio - obstacle_ratio, block_ratio, obstacle_ratio])
+
+    maze = cell_types[choices].tolist()
+    maze[0][0] = GridCellType.START
+    maze[-1][-1] = GridCellType.END
+    return maze
+
+
+def random_graph(num_nodes: int, seed: int = 0, average_degree: float = 4.0, max_weight: int = 100) -> nx.Graph:
+    # A random spanning tree keeps the graph connected, the remaining edges are uniform random pairs
+    rng = np.random.default_rng(seed)
+    graph = nx.Graph()
+    graph.add_nodes_from(range(num_nodes))
+
+    if num_nodes > 1:
+        order = rng.permutation(num_nodes)
+        parents = order[(rng.random(num_nodes - 1) * np.arange(1, num_nodes)).astype(int)]
+        tree_edges = zip(parents.tolist(), order[1:].tolist())
+
+        num_extra_edges = max(0, int(num_nodes * average_degree / 2) - (num_nodes - 1))
+        extra_edges = zip(rng.integers(0, num_nodes, num_extra_edges).tolist(),
+                          rng.integers(0, num_nodes, num_extra_edges).tolist())
+
+        weights = iter(rng.integers(1, max_weight + 1, num_nodes - 1 + num_extra_edges).tolist())
+        graph.add_weighted_edges_from((u, v, next(weights)) for u, v in [*tree_edges, *extra_edges] if u != v)
+
+    return graph
@@ -0,0 +1,144 @@
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Sequence
+
+import numpy as np
+
+from algorithms.bench.generators import random_graph, random_maze
+from algorithms.graph.minimum_spanning_tree.prim_algorithm import PrimAlgorithm
+from algorithms.graph.search.breadth_first_search import BreadthFirstSearch
+from algorithms.graph.search.depth_first_search import DepthFirstSearch
+from algorithms.graph.shortest_path.a_star import AStar
+from algorithms.graph.shortest_path.dijkstra import Dijkstra
+from algorithms.graph.utils import HistoryLogger, encode_history_chunks
+
+RESULTS_FORMAT_VERSION = 1
+
+
+@dataclass
+class BenchmarkResult:
+    algorithm: str
+    size: int
+    seed: int
+    repeat: int
+    wall_time_seconds: float
+    nodes_expanded: int
+    peak_memory_bytes: int
+    history_steps: int
+    history_bytes: int
+
+
+# Each case builds its input outside the timed region and returns the call to measure, which returns the history
+def _bfs_case(size: int, seed: int) -> Callable[[], HistoryLogger]:
+    graph = random_graph(num_nodes=size, seed=seed)
+    return lambda: BreadthFirstSearch(graph).run(start_node=0)[1]
+
+
+def _dfs_case(size: int, seed: int) -> Callable[[], HistoryLogger]:
+    graph = random_graph(num_nodes=size, seed=seed)
+    return lambda: DepthFirstSearch(graph).run(start_node=0)[1]
+
+
+def _dijkstra_case(size: int, seed: int) -> Callable[[], HistoryLogger]:
+    maze = random_maze(num_cells=size, seed=seed)
+    return lambda: Dijkstra(maze).run()[1]
+
+
+def _a_star_case(size: int, seed: int) -> Callable[[], HistoryLogger]:
+    maze = random_maze(num_cells=size, seed=seed)
+    return lambda: AStar(maze).run()[1]
+
+
+def _prim_case(size: int, seed: int) -> Callable[[], HistoryLogger]:
+    graph = random_graph(num_nodes=size, seed=seed)
+    return lambda: PrimAlgorithm(graph).run()[1]
+
+
+BENCHMARK_CASES: Dict[str, Callable[[int, int], Callable[[], HistoryLogger]]] = {
+    'bfs': _bfs_case,
+    'dfs': _dfs_case,
+    'dijkstra': _dijkstra_case,
+    'a_star': _a_star_case,
+    'prim': _prim_case,
+}
+
+
+def run_benchmark(algorithm: str, size: int, seed: int = 0, repeat: int = 3) -> BenchmarkResult:
+    # Wall time is the median over repeat runs; peak memory comes from one extra run under tracemalloc, which
+    # would otherwise slow down the timed runs
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+
+    run_case = BENCHMARK_CASES[algorithm](size, seed)
+
+    wall_times = []
+    for _ in range(repeat):
+        gc.collect()
+        start_time = time.perf_counter()
+        history = run_case()
+        wall_times.append(time.perf_counter() - start_time)
+
+    gc.collect()
+    tracemalloc.start()
+    run_case()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    steps = history.history_dict.values()
+    return BenchmarkResult(algorithm=algorithm, size=size, seed=seed, repeat=repeat,
+                           wall_time_seconds=statistics.median(wall_times), nodes_expanded=history.step,
+                           peak_memory_bytes=peak_memory, history_steps=len(steps),
+                           history_bytes=sum(map(len, encode_history_chunks(steps))))
+
+
+def run_benchmarks(algorithms: Sequence[str], sizes: Sequence[int], seed: int = 0, repeat: int = 3,
+                   progress_callback: Callable[[BenchmarkResult], None] | None = None) -> List[BenchmarkResult]:
+    unknown = set(algorithms) - set(BENCHMARK_CASES)
+    if unknown:
+        raise ValueError(f"Unknown benchmark algorithms: {sorted(unknown)}")
+
+    results = []
+    for algorithm in algorithms:
+        for size in sizes:
+            result = run_benchmark(algorithm=algorithm, size=size, seed=seed, repeat=repeat)
+            results.append(result)
+            if progress_callback is not None:
+                progress_callback(result)
+    return results
+
+
+def scaling_exponents(results: List[BenchmarkResult]) -> Dict[str, float]:
+    # Slope of log(wall time) over log(size) per algorithm: about 1 for linear work, about 2 for quadratic
+    exponents = {}
+    for algorithm in dict.fromkeys(result.algorithm for result in results):
+        points = [(result.size, result.wall_time_seconds) for result in results
+                  if result.algorithm == algorithm and result.wall_time_seconds > 0]
+        if len({size for size, _ in points}) >= 2:
+            sizes, wall_times = np.log(np.array(points)).T
+            exponents[algorithm] = float(np.polyfit(sizes, wall_times, 1)[0])
+    return exponents
+
+
+def save_results(results: List[BenchmarkResult], path: str):
+    document = {
+        'format_version': RESULTS_FORMAT_VERSION,
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'results': [asdict(result) for result in results],
+    }
+    with open(path, 'w') as file:
+        json.dump(document, file, indent=2)
+
+
+def load_results(path: str) -> List[BenchmarkResult]:
+    with open(path) as file:
+        document: Dict[str, Any] = json.load(file)
+    if document.get('format_version') != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"{path} is not a benchmark results file of format version {RESULTS_FORMAT_VERSION}")
+    return [BenchmarkResult(**result) for result in document['results']]
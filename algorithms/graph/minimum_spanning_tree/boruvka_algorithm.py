@@ -0,0 +1,107 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Tuple
+
+import networkx as nx
+import numpy as np
+
+from algorithms.graph.utils import CSRGraph, HistoryLogger, UnionFind, graph_to_edge_list
+
+# Edge arrays handed to each pool worker once through the initializer, so a phase only ships component labels
+_worker_edges: Tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+
+
+def _init_worker(sources: np.ndarray, targets: np.ndarray, weights: np.ndarray):
+    global _worker_edges
+    _worker_edges = (sources, targets, weights)
+
+
+def _cheapest_edges_in_worker(labels: np.ndarray, start: int, stop: int) -> Tuple[np.ndarray, np.ndarray]:
+    sources, targets, weights = _worker_edges
+    return _cheapest_edges(labels=labels, sources=sources[start:stop], targets=targets[start:stop],
+                           weights=weights[start:stop], edge_offset=start)
+
+
+def _cheapest_edges(labels: np.ndarray, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray,
+                    edge_offset: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    source_components, target_components = labels[sources], labels[targets]
+    crossing = np.flatnonzero(source_components != target_components)
+
+    # Every crossing edge is a candidate for both of its components
+    components = np.concatenate([source_components[crossing], target_components[crossing]])
+    edge_ids = np.concatenate([crossing, crossing])
+    return _select_cheapest(components=components, edge_ids=edge_ids + edge_offset,
+                            edge_weights=np.concatenate([weights[crossing], weights[crossing]]))
+
+
+def _select_cheapest(components: np.ndarray, edge_ids: np.ndarray,
+                     edge_weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Ties on weight break on edge id, a strict total order, so the chosen edges can never close a cycle
+    order = np.lexsort((edge_ids, edge_weights, components))
+    components, edge_ids = components[order], edge_ids[order]
+    is_first = np.ones(len(components), dtype=bool)
+    is_first[1:] = components[1:] != components[:-1]
+    return components[is_first], edge_ids[is_first]
+
+
+class BoruvkaAlgorithm:
+    # Like Prim and Kruskal, the history records one node per considered edge: the endpoint it reaches
+    def __init__(self, graph: nx.Graph | CSRGraph, history: HistoryLogger | None = None, workers: int | None = None):
+        self.graph = graph
+        self.nodes = list(graph.nodes) if isinstance(graph, CSRGraph) else list(graph.nodes())
+        self.history = history if history is not None else HistoryLogger()
+        self.workers = workers
+
+    def run(self) -> Tuple[List[Tuple[Any, Any, float]], HistoryLogger]:
+        edges = self.graph.to_edge_list() if isinstance(self.graph, CSRGraph) else graph_to_edge_list(self.graph)
+        node_index = {node: i for i, node in enumerate(self.nodes)}
+        sources = np.array([node_index[u] for _, u, _ in edges], dtype=np.int64)
+        targets = np.array([node_index[v] for _, _, v in edges], dtype=np.int64)
+        weights = np.array([weight for weight, _, _ in edges], dtype=np.float64)
+
+        if self.workers is None or self.workers <= 1:
+            return self._run_phases(sources=sources, targets=targets, weights=weights, executor=None)
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(sources, targets, weights)) as executor:
+            return self._run_phases(sources=sources, targets=targets, weights=weights, executor=executor)
+
+    def _run_phases(self, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray,
+                    executor: ProcessPoolExecutor | None) -> Tuple[List[Tuple[Any, Any, float]], HistoryLogger]:
+        num_nodes = len(self.nodes)
+        components = UnionFind(num_nodes)
+        labels = np.arange(num_nodes)
+        recording = self.history.is_recording
+
+        mst_edges = []
+        while components.num_components > 1:
+            _, edge_ids = self._find_cheapest_edges(labels=labels, sources=sources, targets=targets,
+                                                    weights=weights, executor=executor)
+            # A phase with no edge between two components means the rest of the graph is unreachable
+            if len(edge_ids) == 0:
+                raise ValueError("Cannot compute MST: the input graph is not connected.")
+
+            for edge_id in np.unique(edge_ids).tolist():
+                from_id, to_id = int(sources[edge_id]), int(targets[edge_id])
+                if recording:
+                    self.history.add_new_step(node=self.nodes[to_id])
+                if components.union(from_id, to_id):
+                    mst_edges.append((self.nodes[from_id], self.nodes[to_id], float(weights[edge_id])))
+
+            labels = np.array([components.find(i) for i in range(num_nodes)])
+
+        return mst_edges, self.history
+
+    def _find_cheapest_edges(self, labels: np.ndarray, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray,
+                             executor: ProcessPoolExecutor | None) -> Tuple[np.ndarray, np.ndarray]:
+        if executor is None:
+            return _cheapest_edges(labels=labels, sources=sources, targets=targets, weights=weights)
+
+        bounds = np.linspace(0, len(sources), self.workers + 1).astype(int).tolist()
+        futures = [executor.submit(_cheapest_edges_in_worker, labels, start, stop)
+                   for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+        results = [future.result() for future in futures]
+
+        # Each chunk gives its own cheapest edge per component, the overall one is the cheapest of those
+        components = np.concatenate([chunk_components for chunk_components, _ in results])
+        edge_ids = np.concatenate([chunk_edge_ids for _, chunk_edge_ids in results])
+        return _select_cheapest(components=components, edge_ids=edge_ids, edge_weights=weights[edge_ids])
@@ -0,0 +1,44 @@
+from operator import itemgetter
+from typing import Any, List, Tuple
+
+import networkx as nx
+
+from algorithms.graph.minimum_spanning_tree.spanning_forest import MinimumSpanningForest
+from algorithms.graph.utils import CSRGraph, HistoryLogger, UnionFind, graph_to_edge_list
+
+
+class KruskalAlgorithm:
+    # Like Prim, the history records one node per considered edge: the endpoint it reaches
+    def __init__(self, graph: nx.Graph | CSRGraph, history: HistoryLogger | None = None):
+        self.graph = graph
+        self.nodes = list(graph.nodes) if isinstance(graph, CSRGraph) else list(graph.nodes())
+        self.history = history if history is not None else HistoryLogger()
+
+    def run(self) -> Tuple[List[Tuple[Any, Any, float]], HistoryLogger]:
+        spanning_forest, _ = self.run_forest()
+        if not spanning_forest.is_spanning_tree:
+            raise ValueError("Cannot compute MST: the input graph is not connected.")
+
+        return spanning_forest.edges, self.history
+
+    def run_forest(self) -> Tuple[MinimumSpanningForest, HistoryLogger]:
+        edges = self.graph.to_edge_list() if isinstance(self.graph, CSRGraph) else graph_to_edge_list(self.graph)
+        # Sorting on the weight alone keeps ties in edge list order and never compares node labels
+        edges.sort(key=itemgetter(0))
+
+        node_index = {node: i for i, node in enumerate(self.nodes)}
+        components = UnionFind(len(self.nodes))
+        recording = self.history.is_recording
+
+        mst_edges = []
+        for weight, from_node, to_node in edges:
+            if components.num_components == 1:
+                break
+
+            if recording:
+                self.history.add_new_step(node=to_node)
+
+            if components.union(node_index[from_node], node_index[to_node]):
+                mst_edges.append((from_node, to_node, weight))
+
+        return MinimumSpanningForest(edges=mst_edges, num_nodes=len(self.nodes)), self.history
@@ -3,3 +3,5 @@ from enum import StrEnum
 
 class MinimumSpanningTreeMethod(StrEnum):
     PRIM = 'prim'
+    KRUSKAL = 'kruskal'
+    BORUVKA = 'boruvka'
@@ -1,48 +1,122 @@
 import heapq
+from typing import Any, Generator, List, Tuple
 
 import networkx as nx
 
-from algorithms.graph.utils import graph_to_edge_list, HistoryLogger
+from algorithms.graph.minimum_spanning_tree.spanning_forest import MinimumSpanningForest
+from algorithms.graph.utils import CSRGraph, HistoryLogger, IndexedMinHeap, PriorityQueueType, as_csr_graph
 
 
 class PrimAlgorithm:
-    def __init__(self, graph: nx.Graph):
+    def __init__(self, graph: nx.Graph | CSRGraph, history: HistoryLogger | None = None,
+                 queue_type: PriorityQueueType = PriorityQueueType.BINARY_HEAP):
+        # Prim's keys are edge weights and do not grow monotonically, so a bucket queue does not apply
+        if queue_type == PriorityQueueType.BUCKET:
+            raise ValueError("PrimAlgorithm supports the binary and indexed heap queues only")
+
         self.graph = graph
-        self.nodes = list(graph.nodes())
-        self.history = HistoryLogger()
+        self.queue_type = queue_type
+        self.csr_graph = as_csr_graph(graph)
+        self.nodes = self.csr_graph.nodes
+        self.history = history if history is not None else HistoryLogger()
 
     def run(self):
-        if not nx.is_connected(self.graph):
-            raise ValueError("Cannot compute MST: the input graph is not connected.")
+        mst_edges = self.history.record_steps(self._search(emit_steps=self.history.is_recording, as_forest=False))
+        return mst_edges, self.history
+
+    def run_forest(self) -> Tuple[MinimumSpanningForest, HistoryLogger]:
+        mst_edges = self.history.record_steps(self._search(emit_steps=self.history.is_recording, as_forest=True))
+        return MinimumSpanningForest(edges=mst_edges, num_nodes=self.csr_graph.num_nodes), self.history
+
+    def stream(self) -> Generator[Any, None, List[Tuple[Any, Any, float]]]:
+        return self._search(emit_steps=True, as_forest=False)
+
+    def _search(self, emit_steps: bool, as_forest: bool) -> Generator[Any, None, List[Tuple[Any, Any, float]]]:
+        if self.queue_type == PriorityQueueType.INDEXED_HEAP:
+            return (yield from self._search_indexed(emit_steps=emit_steps, as_forest=as_forest))
 
-        start_node = self.nodes[0]
+        num_nodes = self.csr_graph.num_nodes
+        indptr, indices = self.csr_graph.indptr.tolist(), self.csr_graph.indices.tolist()
+        weights = self.csr_graph.weights.tolist()
+        labels = self.nodes
 
-        mst_nodes = {start_node}
+        in_mst = bytearray(num_nodes)
+        num_mst_nodes = 0
 
         mst_edges = []
 
-        available_edges = []
+        # A tree grows from node 0 only, a forest starts a new tree at every node no earlier tree reached
+        for start_node in range(num_nodes if as_forest else 1):
+            if in_mst[start_node]:
+                continue
+
+            in_mst[start_node] = 1
+            num_mst_nodes += 1
+
+            available_edges = [(weights[i], start_node, indices[i])
+                               for i in range(indptr[start_node], indptr[start_node + 1])]
+            heapq.heapify(available_edges)
+
+            while available_edges and num_mst_nodes < num_nodes:
+                weight, from_node, to_node = heapq.heappop(available_edges)
+                if emit_steps:
+                    yield labels[to_node]
+
+                if in_mst[to_node]:
+                    continue
 
-        for neighbor in self.graph.neighbors(start_node):
-            weight = self.graph[start_node][neighbor]['weight']
-            heapq.heappush(available_edges, (weight, start_node, neighbor))
+                mst_edges.append((labels[from_node], labels[to_node], weight))
+                in_mst[to_node] = 1
+                num_mst_nodes += 1
 
-        while available_edges and len(mst_nodes) < len(self.nodes):
-            weight, from_node, to_node = heapq.heappop(available_edges)
-            self.history.add_new_step(node=to_node)
+                for i in range(indptr[to_node], indptr[to_node + 1]):
+                    neighbor = indices[i]
+                    if not in_mst[neighbor]:
+                        heapq.heappush(available_edges, (weights[i], to_node, neighbor))
 
-            if to_node in mst_nodes:
+        # Running out of edges before reaching every node is how a disconnected graph shows up,
+        # so there is no separate connectivity pass up front
+        if num_mst_nodes < num_nodes:
+            raise ValueError("Cannot compute MST: the input graph is not connected.")
+
+        return mst_edges
+
+    def _search_indexed(self, emit_steps: bool, as_forest: bool) -> Generator[Any, None, List[Tuple[Any, Any, float]]]:
+        # Eager Prim: every node outside the tree is queued once, keyed by its cheapest edge into the tree, and
+        # a cheaper edge lowers that key in place. Each pop adds a node, so no skipped entries reach the history.
+        num_nodes = self.csr_graph.num_nodes
+        indptr, indices = self.csr_graph.indptr.tolist(), self.csr_graph.indices.tolist()
+        weights = self.csr_graph.weights.tolist()
+        labels = self.nodes
+
+        in_mst = bytearray(num_nodes)
+        num_mst_nodes = 0
+        tree_neighbor = [-1] * num_nodes
+        queue = IndexedMinHeap(capacity=num_nodes)
+
+        mst_edges = []
+
+        for start_node in range(num_nodes if as_forest else 1):
+            if in_mst[start_node]:
                 continue
 
-            mst_edges.append((from_node, to_node, weight))
-            mst_nodes.add(to_node)
+            queue.push(0, start_node)
+            while queue:
+                weight, node = queue.pop()
+                in_mst[node] = 1
+                num_mst_nodes += 1
 
-            for neighbor in self.graph.neighbors(to_node):
-                if neighbor not in mst_nodes:
-                    neighbor_weight = self.graph[to_node][neighbor]['weight']
-                    heapq.heappush(available_edges, (neighbor_weight, to_node, neighbor))
+                if node != start_node:
+                    if emit_steps:
+                        yield labels[node]
+                    mst_edges.append((labels[tree_neighbor[node]], labels[node], weight))
 
-        if len(mst_nodes) < len(self.nodes):
-            raise ValueError("Could not construct complete MST")
+                for i in range(indptr[node], indptr[node + 1]):
+                    neighbor = indices[i]
+                    if not in_mst[neighbor] and queue.push(weights[i], neighbor):
+                        tree_neighbor[neighbor] = node
+
+        if num_mst_nodes < num_nodes:
+            raise ValueError("Cannot compute MST: the input graph is not connected.")
 
-        return mst_edges, self.history
\ No newline at end of file
+        return mst_edges
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import Any, List, Tuple
+
+
+@dataclass
+class MinimumSpanningForest:
+    edges: List[Tuple[Any, Any, float]]
+    num_nodes: int
+
+    @property
+    def num_components(self) -> int:
+        return self.num_nodes - len(self.edges)
+
+    @property
+    def total_weight(self) -> float:
+        return sum(weight for _, _, weight in self.edges)
+
+    @property
+    def is_spanning_tree(self) -> bool:
+        return self.num_components == 1
@@ -0,0 +1,109 @@
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from algorithms.graph.minimum_spanning_tree.spanning_forest import MinimumSpanningForest
+from algorithms.graph.utils import UnionFind
+
+# On disk an edge list is a flat array of these records, no header, so np.memmap opens it without reading it
+EDGE_RECORD_DTYPE = np.dtype([('u', '<i8'), ('v', '<i8'), ('weight', '<f8')])
+
+
+def write_edge_file(path: str | Path, edges: Iterable[Tuple[int, int, float]], chunk_size: int = 1 << 20) -> int:
+    # Same (u, v, weight) layout as edge_list_to_graph, node labels must be ints
+    num_edges = 0
+    edges = iter(edges)
+    with open(path, 'wb') as file:
+        while True:
+            chunk = np.array(list(islice(edges, chunk_size)), dtype=EDGE_RECORD_DTYPE)
+            if not len(chunk):
+                return num_edges
+            file.write(chunk.tobytes())
+            num_edges += len(chunk)
+
+
+def read_edge_file(path: str | Path) -> np.ndarray:
+    if Path(path).stat().st_size == 0:
+        return np.empty(0, dtype=EDGE_RECORD_DTYPE)
+    return np.memmap(path, dtype=EDGE_RECORD_DTYPE, mode='r')
+
+
+class StreamingMST:
+    # Kruskal with a sparsifying filter: the edges are read chunk by chunk and only the minimum spanning forest of
+    # everything seen so far is kept. An edge dropped from that forest closes a cycle in which it is the heaviest
+    # edge, so it can never be part of the final forest either. Memory stays O(nodes + chunk_size) however long
+    # the edge list is.
+    def __init__(self, chunk_size: int = 1 << 20):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.chunk_size = chunk_size
+
+    def run(self, edges: Iterable[Tuple[Any, Any, float]] | np.ndarray | str | Path) -> MinimumSpanningForest:
+        # Accepts (u, v, weight) tuples with any hashable labels, an EDGE_RECORD_DTYPE array (memmaps included)
+        # or the path of a file written by write_edge_file
+        if isinstance(edges, (str, Path)):
+            edges = read_edge_file(edges)
+
+        if isinstance(edges, np.ndarray):
+            node_labels = None
+            chunks = (edges[start:start + self.chunk_size] for start in range(0, len(edges), self.chunk_size))
+        else:
+            node_labels = {}
+            chunks = self._label_chunks(edges=edges, node_index=node_labels)
+
+        forest = np.empty(0, dtype=EDGE_RECORD_DTYPE)
+        seen_nodes = np.empty(0, dtype=np.int64)
+        for chunk in chunks:
+            seen_nodes = self._merge_nodes(seen_nodes=seen_nodes, chunk=chunk)
+            forest = self._spanning_forest(np.concatenate([forest, np.asarray(chunk, dtype=EDGE_RECORD_DTYPE)]))
+
+        if node_labels is None:
+            mst_edges = list(zip(forest['u'].tolist(), forest['v'].tolist(), forest['weight'].tolist()))
+        else:
+            labels = list(node_labels)
+            mst_edges = [(labels[u], labels[v], weight) for u, v, weight in
+                         zip(forest['u'].tolist(), forest['v'].tolist(), forest['weight'].tolist())]
+
+        return MinimumSpanningForest(edges=mst_edges, num_nodes=len(seen_nodes))
+
+    def _label_chunks(self, edges: Iterable[Tuple[Any, Any, float]],
+                      node_index: Dict[Any, int]) -> Iterator[np.ndarray]:
+        # Labels get int ids in order of first appearance; node_index is filled as the chunks are consumed
+        edges = iter(edges)
+        while True:
+            chunk: List[Tuple[int, int, float]] = []
+            for u, v, weight in islice(edges, self.chunk_size):
+                u_id = node_index.setdefault(u, len(node_index))
+                v_id = node_index.setdefault(v, len(node_index))
+                chunk.append((u_id, v_id, weight))
+            if not chunk:
+                return
+            yield np.array(chunk, dtype=EDGE_RECORD_DTYPE)
+
+    @staticmethod
+    def _merge_nodes(seen_nodes: np.ndarray, chunk: np.ndarray) -> np.ndarray:
+        # Sorted distinct node ids seen so far, so memory follows the number of nodes rather than the largest id
+        if not len(chunk):
+            return seen_nodes
+        if min(chunk['u'].min(), chunk['v'].min()) < 0:
+            raise ValueError("Node ids of an edge array must be non negative")
+        return np.union1d(seen_nodes, np.concatenate([chunk['u'], chunk['v']]))
+
+    @staticmethod
+    def _spanning_forest(edges: np.ndarray) -> np.ndarray:
+        # The current forest comes first in edges and the sort is stable, so weight ties keep the older edge
+        edges = edges[np.argsort(edges['weight'], kind='stable')]
+        node_ids, endpoints = np.unique(np.concatenate([edges['u'], edges['v']]), return_inverse=True)
+        sources, targets = endpoints[:len(edges)].tolist(), endpoints[len(edges):].tolist()
+
+        components = UnionFind(len(node_ids))
+        kept = []
+        for i, (u, v) in enumerate(zip(sources, targets)):
+            if components.union(u, v):
+                kept.append(i)
+                if components.num_components == 1:
+                    break
+
+        return edges[kept]
@@ -1,34 +1,50 @@
 from collections import deque
-from typing import Set, Tuple
+from typing import Any, Generator, Tuple
 
 import networkx as nx
+from algorithms.graph.utils import CSRGraph, as_csr_graph
 from algorithms.graph.utils.history import HistoryLogger
 
 
 class BreadthFirstSearch:
-    def __init__(self, graph: nx.Graph):
+    def __init__(self, graph: nx.Graph | CSRGraph, history: HistoryLogger | None = None):
         self.graph = graph
-        self.nodes = set(graph.nodes())
-        self.history = HistoryLogger()
+        self.csr_graph = as_csr_graph(graph, weight=None)
+        self.nodes = set(self.csr_graph.nodes)
+        self.history = history if history is not None else HistoryLogger()
 
     def run(self, start_node) -> Tuple[bool, HistoryLogger]:
-        if start_node not in self.graph:
-            return False, self.history
+        is_connected = self.history.record_steps(self._search(start_node=start_node,
+                                                              emit_steps=self.history.is_recording))
+        return is_connected, self.history
 
-        queue = deque([start_node])
-        visit_set: Set = set()
+    def stream(self, start_node) -> Generator[Any, None, bool]:
+        return self._search(start_node=start_node, emit_steps=True)
+
+    def _search(self, start_node, emit_steps: bool) -> Generator[Any, None, bool]:
+        if start_node not in self.csr_graph:
+            return False
+
+        indptr, indices = self.csr_graph.indptr.tolist(), self.csr_graph.indices.tolist()
+        labels = self.csr_graph.nodes
+
+        queue = deque([self.csr_graph.node_index[start_node]])
+        visited = bytearray(self.csr_graph.num_nodes)
+        num_visited = 0
 
         while queue:
             node = queue.popleft()
-            self.history.add_new_step(node=node)
+            if emit_steps:
+                yield labels[node]
 
-            if node in visit_set:
+            if visited[node]:
                 continue
 
-            visit_set.add(node)
+            visited[node] = 1
+            num_visited += 1
 
-            for next_node in self.graph.neighbors(node):
-                if next_node not in visit_set:
+            for next_node in indices[indptr[node]:indptr[node + 1]]:
+                if not visited[next_node]:
                     queue.append(next_node)
 
-        return visit_set == self.nodes, self.history
+        return num_visited == self.csr_graph.num_nodes
@@ -1,34 +1,118 @@
-from typing import Set, Tuple
+from typing import Any, Callable, Dict, Generator, Tuple
 
 import networkx as nx
+from algorithms.graph.utils import CSRGraph, as_csr_graph
 from algorithms.graph.utils.history import HistoryLogger
 
 
 class DepthFirstSearch:
-    def __init__(self, graph: nx.Graph):
+    def __init__(self, graph: nx.Graph | CSRGraph, history: HistoryLogger | None = None):
         self.graph = graph
-        self.nodes = set(graph.nodes())
-        self.history = HistoryLogger()
+        self.csr_graph = as_csr_graph(graph, weight=None)
+        self.nodes = set(self.csr_graph.nodes)
+        self.history = history if history is not None else HistoryLogger()
 
-    def run(self, start_node) -> Tuple[bool, HistoryLogger]:
-        if start_node not in self.graph:
+    def run(self, start_node, pre_order: Callable[[Any], None] | None = None,
+            post_order: Callable[[Any], None] | None = None) -> Tuple[bool, HistoryLogger]:
+        steps = self._search(start_node=start_node, pre_order=pre_order, post_order=post_order,
+                             emit_steps=self.history.is_recording)
+        is_connected = self.history.record_steps(steps)
+        return is_connected, self.history
+
+    def stream(self, start_node, pre_order: Callable[[Any], None] | None = None,
+               post_order: Callable[[Any], None] | None = None) -> Generator[Any, None, bool]:
+        return self._search(start_node=start_node, pre_order=pre_order, post_order=post_order, emit_steps=True)
+
+    def run_iterative_deepening(self, start_node, goal_node, max_depth: int | None = None) -> Tuple[int, HistoryLogger]:
+        if start_node not in self.csr_graph or goal_node not in self.csr_graph:
+            return -1, self.history
+
+        if max_depth is None:
+            max_depth = self.csr_graph.num_nodes - 1
+
+        recording = self.history.is_recording
+        indptr, indices = self.csr_graph.indptr.tolist(), self.csr_graph.indices.tolist()
+        labels = self.csr_graph.nodes
+        start, goal = self.csr_graph.node_index[start_node], self.csr_graph.node_index[goal_node]
+
+        for depth_limit in range(max_depth + 1):
+            # A node is expanded again only when reached at a smaller depth than before in this pass
+            best_depths: Dict[int, int] = {start: 0}
+            stack = [(start, 0)]
+            was_cut_off = False
+
+            while stack:
+                node, depth = stack.pop()
+                if depth > best_depths[node]:
+                    continue
+
+                if recording:
+                    self.history.add_new_step(node=labels[node])
+
+                if node == goal:
+                    return depth, self.history
+
+                if depth == depth_limit:
+                    was_cut_off = True
+                    continue
+
+                # Reversed so the first neighbor is popped first, as in the recursive visit order
+                for next_node in reversed(indices[indptr[node]:indptr[node + 1]]):
+                    if depth + 1 < best_depths.get(next_node, depth + 2):
+                        best_depths[next_node] = depth + 1
+                        stack.append((next_node, depth + 1))
+
+            if not was_cut_off:
+                break
+
+        return -1, self.history
+
+    def _search(self, start_node, pre_order: Callable[[Any], None] | None,
+                post_order: Callable[[Any], None] | None, emit_steps: bool) -> Generator[Any, None, bool]:
+        if start_node not in self.csr_graph:
             return False
 
-        visited_set: Set = set()
+        indptr, indices = self.csr_graph.indptr.tolist(), self.csr_graph.indices.tolist()
+        labels = self.csr_graph.nodes
+
+        start = self.csr_graph.node_index[start_node]
+        visited = bytearray(self.csr_graph.num_nodes)
+        visited[start] = 1
+        num_visited = 1
+
+        if emit_steps:
+            yield start_node
+        if pre_order is not None:
+            pre_order(start_node)
+
+        # Explicit stack of nodes and the position of each one's next unexplored edge, resumed exactly where the
+        # recursive call would continue. Plain int stacks keep the garbage collector out of deep searches.
+        node_stack, edge_stack = [start], [indptr[start]]
 
-        def dfs(at):
-            if at in visited_set:
-                return False, self.history
+        while node_stack:
+            at = node_stack[-1]
+            position, end = edge_stack[-1], indptr[at + 1]
+            while position < end and visited[indices[position]]:
+                position += 1
 
-            self.history.add_new_step(node=at)
+            if position == end:
+                node_stack.pop()
+                edge_stack.pop()
+                if post_order is not None:
+                    post_order(labels[at])
+                continue
 
-            visited_set.add(at)
+            next_node = indices[position]
+            edge_stack[-1] = position + 1
+            visited[next_node] = 1
+            num_visited += 1
 
-            for next_node in self.graph.neighbors(at):
-                if next_node not in visited_set:
-                    dfs(next_node)
+            if emit_steps:
+                yield labels[next_node]
+            if pre_order is not None:
+                pre_order(labels[next_node])
 
-            return True
+            node_stack.append(next_node)
+            edge_stack.append(indptr[next_node])
 
-        dfs(start_node)
-        return len(visited_set) == len(self.nodes), self.history
+        return num_visited == self.csr_graph.num_nodes
@@ -1,53 +1,123 @@
 import heapq
-from typing import List, Tuple
+from typing import Any, Generator, List, Tuple
 
-import numpy as np
-from algorithms.graph.utils import GridCellType, find_char_location
+from algorithms.graph.utils import CompiledGrid, CSRGraph, GridCellType, compile_maze
 from algorithms.graph.utils.history import HistoryLogger
 
 
 class AStar:
-    def __init__(self, maze: List[List[GridCellType]]):
-        self.maze = maze
-        self.height, self.width = len(self.maze), len(self.maze[0])
-        self.history = HistoryLogger()
+    def __init__(self, maze: List[List[GridCellType]] | CompiledGrid | CSRGraph, history: HistoryLogger | None = None,
+                 start_node: Any = None, goal_node: Any = None):
+        self.history = history if history is not None else HistoryLogger()
 
-        self.start_point = find_char_location(maze=self.maze, wanted_char=GridCellType.START)
-        self.goal_point = find_char_location(maze=self.maze, wanted_char=GridCellType.END)
+        # A CSRGraph has no START / END cells, so its endpoints are given as node labels
+        if isinstance(maze, CSRGraph):
+            self.graph, self.grid = maze, None
+            self.height = self.width = None
+            self.start_point, self.goal_point = start_node, goal_node
+        else:
+            self.graph, self.grid = None, compile_maze(maze)
+            self.height, self.width = self.grid.height, self.grid.width
+            self.start_point = self.grid.start_point
+            self.goal_point = self.grid.goal_point
+            self.history.bind_grid(self.grid.stride)
 
     def run(self, heuristic_func=None) -> Tuple[int, HistoryLogger]:
-        min_distances = np.full((self.height, self.width), np.inf)
+        steps = self._search(heuristic_func=heuristic_func, emit_steps=self.history.is_recording)
+        distance = self.history.record_steps(steps)
+        return distance, self.history
+
+    def stream(self, heuristic_func=None) -> Generator[Any, None, int]:
+        return self._search(heuristic_func=heuristic_func, emit_steps=True)
+
+    def _search(self, heuristic_func, emit_steps: bool) -> Generator[Any, None, int]:
+        if self.graph is not None:
+            return (yield from self._search_graph(heuristic_func=heuristic_func, emit_steps=emit_steps))
+        return (yield from self._search_grid(heuristic_func=heuristic_func, emit_steps=emit_steps))
+
+    def _search_graph(self, heuristic_func, emit_steps: bool) -> Generator[Any, None, float]:
+        if self.start_point not in self.graph or self.goal_point not in self.graph:
+            raise ValueError("start_node and goal_node must both be nodes of the graph")
 
-        y_s, x_s = self.start_point
-        y_e, x_e = self.goal_point
+        start, goal = self.graph.node_index[self.start_point], self.graph.node_index[self.goal_point]
+        indptr, indices = self.graph.indptr.tolist(), self.graph.indices.tolist()
+        weights = self.graph.weights.tolist()
+        labels = self.graph.nodes
 
-        if heuristic_func is None:
-            h_n = lambda ny, nx: abs(ny - y_e) + abs(nx - x_e)  # noqa
+        # (row, col) labels, as produced by CSRGraph.from_grid, get the same Manhattan default as the grid.
+        # Any other labels fall back to a zero heuristic unless heuristic_func(node) is given.
+        is_grid_graph = isinstance(self.goal_point, tuple) and len(self.goal_point) == 2
+        if heuristic_func is None and is_grid_graph:
+            y_e, x_e = self.goal_point
+            h_n = lambda node: abs(node[0] - y_e) + abs(node[1] - x_e)  # noqa
+        elif heuristic_func is None:
+            h_n = lambda node: 0  # noqa
+        elif is_grid_graph:
+            h_n = lambda node: heuristic_func(ny=node[0], nx=node[1])  # noqa
         else:
             h_n = heuristic_func
 
-        heap = [(0, y_s, x_s)]
-        min_distances[y_s, x_s] = 0
-        directions = [[0, 1], [0, -1], [1, 0], [-1, 0]]
-
-        g_n = lambda ny, nx: 4 if self.maze[ny][nx] == GridCellType.OBSTACLE else 1  # noqa
+        min_distances = [float('inf')] * self.graph.num_nodes
+        min_distances[start] = 0
+        heap = [(0, start)]
 
         while heap:
-            _, y, x = heapq.heappop(heap)
-            self.history.add_new_step((y, x))
+            _, node = heapq.heappop(heap)
+            if emit_steps:
+                yield labels[node]
+
+            if node == goal:
+                return min_distances[goal]
+
+            node_distance = min_distances[node]
+            for i in range(indptr[node], indptr[node + 1]):
+                neighbor = indices[i]
+                g_val = node_distance + weights[i]
+                if g_val < min_distances[neighbor]:
+                    min_distances[neighbor] = g_val
+                    heapq.heappush(heap, (g_val + h_n(labels[neighbor]), neighbor))
 
-            if x == x_e and y == y_e:
-                return min_distances[y_e, x_e], self.history
+        return -1
+
+    def _search_grid(self, heuristic_func, emit_steps: bool) -> Generator[Tuple[int, int], None, int]:
+        if self.grid.start is None or self.grid.goal is None:
+            raise ValueError("Maze must contain both a START and an END cell")
+
+        start, goal = self.grid.start, self.grid.goal
+        costs = self.grid.costs.tolist()
+        offsets = self.grid.neighbor_offsets
+        stride = self.grid.stride
+        to_coords = self.grid.to_coords
+
+        # Padded coordinates: the one cell border shifts y and x by the same amount, so distances match
+        y_e, x_e = divmod(goal, stride)
+
+        min_distances = [float('inf')] * len(costs)
+        min_distances[start] = 0
+        heap = [(0, start)]
+
+        while heap:
+            _, node = heapq.heappop(heap)
+            if emit_steps:
+                yield to_coords(node)
 
-            neighbors = [(y + dy, x + dx) for dx, dy in directions
-                         if 0 <= x + dx < self.width and 0 <= y + dy < self.height
-                         and self.maze[y + dy][x + dx] != GridCellType.BLOCK]
+            if node == goal:
+                return min_distances[goal]
 
-            for n_y, n_x in neighbors:
-                g_val = min_distances[y, x] + g_n(ny=n_y, nx=n_x)
-                if g_val < min_distances[n_y, n_x]:
-                    min_distances[n_y, n_x] = g_val
-                    h_val = h_n(ny=n_y, nx=n_x)
-                    heapq.heappush(heap, (g_val + h_val, n_y, n_x))
+            node_distance = min_distances[node]
+            for offset in offsets:
+                neighbor = node + offset
+                cost = costs[neighbor]
+                if cost:
+                    g_val = node_distance + cost
+                    if g_val < min_distances[neighbor]:
+                        min_distances[neighbor] = g_val
+                        if heuristic_func is None:
+                            n_y, n_x = divmod(neighbor, stride)
+                            h_val = abs(n_y - y_e) + abs(n_x - x_e)
+                        else:
+                            n_y, n_x = to_coords(neighbor)
+                            h_val = heuristic_func(ny=n_y, nx=n_x)
+                        heapq.heappush(heap, (g_val + h_val, neighbor))
 
-        return -1, self.history
+        return -1
@@ -0,0 +1,84 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from algorithms.graph.shortest_path.a_star import AStar
+from algorithms.graph.shortest_path.bidirectional import BidirectionalAStar, BidirectionalDijkstra
+from algorithms.graph.shortest_path.dijkstra import Dijkstra
+from algorithms.graph.shortest_path.hierarchical_a_star import HierarchicalAStar
+from algorithms.graph.shortest_path.jump_point_search import JumpPointSearch
+from algorithms.graph.shortest_path.lifelong_planning_a_star import LifelongPlanningAStar
+from algorithms.graph.shortest_path.methods import ShortestPathMethod
+from algorithms.graph.utils import CompiledGrid, GridCellType, HistoryLogger, HistoryMode, compile_maze
+
+SHORTEST_PATH_SOLVERS = {
+    ShortestPathMethod.DIJKSTRA: Dijkstra,
+    ShortestPathMethod.A_STAR: AStar,
+    ShortestPathMethod.BIDIRECTIONAL_DIJKSTRA: BidirectionalDijkstra,
+    ShortestPathMethod.BIDIRECTIONAL_A_STAR: BidirectionalAStar,
+    ShortestPathMethod.JUMP_POINT_SEARCH: JumpPointSearch,
+    ShortestPathMethod.HIERARCHICAL_A_STAR: HierarchicalAStar,
+    ShortestPathMethod.LIFELONG_PLANNING_A_STAR: LifelongPlanningAStar,
+}
+
+# Shared memory block holding every maze's cell codes, attached once per pool worker by the initializer
+_worker_block: shared_memory.SharedMemory | None = None
+
+
+@dataclass
+class BatchResult:
+    distance: int
+    history: HistoryLogger
+    elapsed_seconds: float
+
+
+def _init_worker(block_name: str):
+    global _worker_block
+    _worker_block = shared_memory.SharedMemory(name=block_name)
+
+
+def _solve_shared(method: ShortestPathMethod, history_mode: HistoryMode, offset: int,
+                  shape: Tuple[int, int]) -> BatchResult:
+    codes = np.ndarray(shape, dtype=np.uint8, buffer=_worker_block.buf, offset=offset)
+    # CompiledGrid copies the codes into its own padded array, so nothing keeps a view on the block
+    return _solve(method=method, grid=CompiledGrid(codes=codes), history_mode=history_mode)
+
+
+def _solve(method: ShortestPathMethod, grid: CompiledGrid, history_mode: HistoryMode) -> BatchResult:
+    start_time = time.perf_counter()
+    solver = SHORTEST_PATH_SOLVERS[method](grid, history=HistoryLogger(mode=history_mode))
+    distance, history = solver.run()
+    return BatchResult(distance=distance, history=history, elapsed_seconds=time.perf_counter() - start_time)
+
+
+def solve_many(mazes: Sequence[List[List[GridCellType]] | CompiledGrid],
+               method: ShortestPathMethod = ShortestPathMethod.A_STAR, workers: int | None = None,
+               history_mode: HistoryMode = HistoryMode.FULL) -> List[BatchResult]:
+    # Results come back in maze order. elapsed_seconds covers building the solver and running it in the worker,
+    # not the transfer. With workers, full histories are pickled back, so HistoryMode.OFF is the fast choice.
+    method = ShortestPathMethod(method)
+    grids = [compile_maze(maze) for maze in mazes]
+
+    if workers is None or workers <= 1 or not grids:
+        return [_solve(method=method, grid=grid, history_mode=history_mode) for grid in grids]
+
+    # Every maze's unpadded codes go into one shared block; a job is just its offset and shape
+    cell_grids = [grid.codes.reshape(grid.height + 2, grid.stride)[1:-1, 1:-1] for grid in grids]
+    offsets = np.concatenate([[0], np.cumsum([cells.size for cells in cell_grids])]).tolist()
+
+    block = shared_memory.SharedMemory(create=True, size=max(offsets[-1], 1))
+    try:
+        for cells, offset in zip(cell_grids, offsets):
+            np.ndarray(cells.shape, dtype=np.uint8, buffer=block.buf, offset=offset)[:] = cells
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(block.name,)) as executor:
+            return list(executor.map(_solve_shared, [method] * len(grids), [history_mode] * len(grids),
+                                     offsets[:-1], [cells.shape for cells in cell_grids],
+                                     chunksize=max(1, len(grids) // (4 * workers))))
+    finally:
+        block.close()
+        block.unlink()
@@ -0,0 +1,112 @@
+import heapq
+from typing import List, Tuple
+
+from algorithms.graph.utils import CompiledGrid, GridCellType, compile_maze
+from algorithms.graph.utils.history import HistoryLogger
+
+
+def bidirectional_search(grid: CompiledGrid, history: HistoryLogger, use_heuristic: bool) -> int:
+    if grid.start is None or grid.goal is None:
+        raise ValueError("Maze must contain both a START and an END cell")
+
+    start, goal = grid.start, grid.goal
+    costs = grid.costs.tolist()
+    offsets = grid.neighbor_offsets
+    stride = grid.stride
+    to_coords = grid.to_coords
+    recording = history.is_recording
+    inf = float('inf')
+
+    y_s, x_s = divmod(start, stride)
+    y_e, x_e = divmod(goal, stride)
+
+    # Average potential p(v) = (h_goal(v) - h_start(v)) / 2, kept doubled so every key stays an integer.
+    # The backward search uses -p(v), which makes both directions work on the same reduced costs and
+    # lets them stop once the two top keys cover the best meeting distance.
+    def potential(node):
+        if not use_heuristic:
+            return 0
+        y, x = divmod(node, stride)
+        return abs(y - y_e) + abs(x - x_e) - abs(y - y_s) - abs(x - x_s)
+
+    forward_distances = [inf] * len(costs)
+    backward_distances = [inf] * len(costs)
+    forward_distances[start] = 0
+    backward_distances[goal] = 0
+
+    forward_heap = [(potential(start), start)]
+    backward_heap = [(-potential(goal), goal)]
+    best_distance = 0 if start == goal else inf
+
+    while forward_heap and backward_heap:
+        if forward_heap[0][0] + backward_heap[0][0] >= 2 * best_distance:
+            break
+
+        is_forward = len(forward_heap) <= len(backward_heap)
+        if is_forward:
+            key, node = heapq.heappop(forward_heap)
+            node_distance = forward_distances[node]
+            if key > 2 * node_distance + potential(node):
+                continue
+            if recording:
+                history.add_new_step(to_coords(node))
+
+            for offset in offsets:
+                neighbor = node + offset
+                cost = costs[neighbor]
+                if not cost:
+                    continue
+                g_val = node_distance + cost
+                if g_val < forward_distances[neighbor]:
+                    forward_distances[neighbor] = g_val
+                    heapq.heappush(forward_heap, (2 * g_val + potential(neighbor), neighbor))
+                    best_distance = min(best_distance, g_val + backward_distances[neighbor])
+        else:
+            key, node = heapq.heappop(backward_heap)
+            node_distance = backward_distances[node]
+            if key > 2 * node_distance - potential(node):
+                continue
+            if recording:
+                history.add_new_step(to_coords(node))
+
+            # Stepping back from node to a predecessor still pays the cost of entering node
+            cost = costs[node]
+            for offset in offsets:
+                neighbor = node + offset
+                if not costs[neighbor] and neighbor != start:
+                    continue
+                g_val = node_distance + cost
+                if g_val < backward_distances[neighbor]:
+                    backward_distances[neighbor] = g_val
+                    heapq.heappush(backward_heap, (2 * g_val - potential(neighbor), neighbor))
+                    best_distance = min(best_distance, g_val + forward_distances[neighbor])
+
+    return -1 if best_distance == inf else best_distance
+
+
+class BidirectionalDijkstra:
+    def __init__(self, maze: List[List[GridCellType]] | CompiledGrid, history: HistoryLogger | None = None):
+        self.grid = compile_maze(maze)
+        self.height, self.width = self.grid.height, self.grid.width
+        self.history = history if history is not None else HistoryLogger()
+        self.history.bind_grid(self.grid.stride)
+
+        self.start_point = self.grid.start_point
+        self.goal_point = self.grid.goal_point
+
+    def run(self) -> Tuple[int, HistoryLogger]:
+        return bidirectional_search(grid=self.grid, history=self.history, use_heuristic=False), self.history
+
+
+class BidirectionalAStar:
+    def __init__(self, maze: List[List[GridCellType]] | CompiledGrid, history: HistoryLogger | None = None):
+        self.grid = compile_maze(maze)
+        self.height, self.width = self.grid.height, self.grid.width
+        self.history = history if history is not None else HistoryLogger()
+        self.history.bind_grid(self.grid.stride)
+
+        self.start_point = self.grid.start_point
+        self.goal_point = self.grid.goal_point
+
+    def run(self) -> Tuple[int, HistoryLogger]:
+        return bidirectional_search(grid=self.grid, history=self.history, use_heuristic=True), self.history
@@ -1,49 +1,190 @@
 import heapq
-from typing import List, Tuple
+from typing import Any, Generator, List, Tuple
 
 import numpy as np
 
-from algorithms.graph.utils import (find_char_location,
-                                    GridCellType)
+from algorithms.graph.utils import (BucketQueue, CompiledGrid, CSRGraph, GridCellType, IndexedMinHeap,
+                                    PriorityQueueType, compile_maze)
 from algorithms.graph.utils.history import HistoryLogger
 
 
 class Dijkstra:
-    def __init__(self, maze: List[List[GridCellType]]):
-        self.maze = maze
-        self.height, self.width = len(self.maze), len(self.maze[0])
-        self.history = HistoryLogger()
+    def __init__(self, maze: List[List[GridCellType]] | CompiledGrid | CSRGraph, history: HistoryLogger | None = None,
+                 start_node: Any = None, goal_node: Any = None,
+                 queue_type: PriorityQueueType = PriorityQueueType.BINARY_HEAP):
+        self.history = history if history is not None else HistoryLogger()
+        self.queue_type = queue_type
 
-        self.start_point = find_char_location(maze=self.maze, wanted_char=GridCellType.START)
-        self.goal_point = find_char_location(maze=self.maze, wanted_char=GridCellType.END)
+        # A CSRGraph has no START / END cells, so its endpoints are given as node labels
+        if isinstance(maze, CSRGraph):
+            self.graph, self.grid = maze, None
+            self.height = self.width = None
+            self.start_point, self.goal_point = start_node, goal_node
+        else:
+            self.graph, self.grid = None, compile_maze(maze)
+            self.height, self.width = self.grid.height, self.grid.width
+            self.start_point = self.grid.start_point
+            self.goal_point = self.grid.goal_point
+            self.history.bind_grid(self.grid.stride)
 
     def run(self) -> Tuple[int, HistoryLogger]:
-        min_distances = np.full((self.height, self.width), np.inf)
+        distance = self.history.record_steps(self._search(emit_steps=self.history.is_recording))
+        return distance, self.history
 
-        y_s, x_s = self.start_point
-        y_e, x_e = self.goal_point
+    def stream(self) -> Generator[Any, None, int]:
+        return self._search(emit_steps=True)
 
-        heap = [(0, y_s, x_s)]
-        min_distances[y_s, x_s] = 0
-        directions = [[0, 1], [0, -1], [1, 0], [-1, 0]]
+    def _search(self, emit_steps: bool) -> Generator[Any, None, int]:
+        if self.graph is not None:
+            return (yield from self._search_graph(emit_steps=emit_steps))
+        return (yield from self._search_grid(emit_steps=emit_steps))
 
-        g_n = lambda g_y, g_x: 4 if self.maze[g_y][g_x] == GridCellType.OBSTACLE else 1
+    def _search_graph(self, emit_steps: bool) -> Generator[Any, None, float]:
+        if self.start_point not in self.graph or self.goal_point not in self.graph:
+            raise ValueError("start_node and goal_node must both be nodes of the graph")
+
+        start, goal = self.graph.node_index[self.start_point], self.graph.node_index[self.goal_point]
+        indptr, indices = self.graph.indptr.tolist(), self.graph.indices.tolist()
+        weights = self.graph.weights.tolist()
+        labels = self.graph.nodes
+
+        min_distances = [float('inf')] * self.graph.num_nodes
+        min_distances[start] = 0
+
+        if self.queue_type != PriorityQueueType.BINARY_HEAP:
+            queue = self._make_queue(capacity=self.graph.num_nodes, weights=self.graph.weights)
+            if isinstance(queue, BucketQueue):
+                # Bucket keys index a list, so the integer valued float weights become ints
+                weights = self.graph.weights.astype(np.int64).tolist()
+            queue.push(0, start)
+            while queue:
+                weight, node = queue.pop()
+                # Only the lazy bucket queue can hand back an entry whose node was settled at a smaller distance
+                if weight > min_distances[node]:
+                    continue
+                if emit_steps:
+                    yield labels[node]
+
+                if node == goal:
+                    return weight
+
+                for i in range(indptr[node], indptr[node + 1]):
+                    neighbor = indices[i]
+                    g_val = weight + weights[i]
+                    if g_val < min_distances[neighbor]:
+                        min_distances[neighbor] = g_val
+                        queue.push(g_val, neighbor)
+
+            return -1
+
+        heap = [(0, start)]
 
         while heap:
-            weight, y, x = heapq.heappop(heap)
-            self.history.add_new_step((y, x))
+            weight, node = heapq.heappop(heap)
+            if emit_steps:
+                yield labels[node]
+
+            if node == goal:
+                return weight
+
+            node_distance = min_distances[node]
+            for i in range(indptr[node], indptr[node + 1]):
+                neighbor = indices[i]
+                g_val = node_distance + weights[i]
+                if g_val < min_distances[neighbor]:
+                    min_distances[neighbor] = g_val
+                    heapq.heappush(heap, (g_val, neighbor))
+
+        return -1
+
+    def _search_grid(self, emit_steps: bool) -> Generator[Tuple[int, int], None, int]:
+        if self.grid.start is None or self.grid.goal is None:
+            raise ValueError("Maze must contain both a START and an END cell")
+
+        start, goal = self.grid.start, self.grid.goal
+        costs = self.grid.costs.tolist()
+        offsets = self.grid.neighbor_offsets
+        to_coords = self.grid.to_coords
+
+        min_distances = [float('inf')] * len(costs)
+        min_distances[start] = 0
+
+        if self.queue_type != PriorityQueueType.BINARY_HEAP:
+            queue = self._make_queue(capacity=len(costs), weights=self.grid.costs)
+            queue.push(0, start)
+            while queue:
+                weight, node = queue.pop()
+                if weight > min_distances[node]:
+                    continue
+                if emit_steps:
+                    yield to_coords(node)
+
+                if node == goal:
+                    return weight
+
+                for offset in offsets:
+                    neighbor = node + offset
+                    cost = costs[neighbor]
+                    if cost:
+                        g_val = weight + cost
+                        if g_val < min_distances[neighbor]:
+                            min_distances[neighbor] = g_val
+                            queue.push(g_val, neighbor)
+
+            return -1
+
+        heap = [(0, start)]
+
+        while heap:
+            weight, node = heapq.heappop(heap)
+            if emit_steps:
+                yield to_coords(node)
+
+            if node == goal:
+                return weight
+
+            node_distance = min_distances[node]
+            for offset in offsets:
+                neighbor = node + offset
+                cost = costs[neighbor]
+                if cost:
+                    g_val = node_distance + cost
+                    if g_val < min_distances[neighbor]:
+                        min_distances[neighbor] = g_val
+                        heapq.heappush(heap, (g_val, neighbor))
+
+        return -1
+
+    def _make_queue(self, capacity: int, weights: np.ndarray) -> IndexedMinHeap | BucketQueue:
+        if self.queue_type == PriorityQueueType.INDEXED_HEAP:
+            return IndexedMinHeap(capacity=capacity)
+
+        if len(weights) and (weights.min() < 0 or not np.array_equal(weights, np.round(weights))):
+            raise ValueError("A bucket queue needs non negative integer edge weights")
+        return BucketQueue(max_step=int(weights.max()) if len(weights) else 0)
+
+
+def compute_distance_field(grid: CompiledGrid, source: int) -> List[float]:
+    # Full single-source Dijkstra over the padded flat index space, unreachable cells stay at inf
+    costs = grid.costs.tolist()
+    offsets = grid.neighbor_offsets
 
-            if x == x_e and y == y_e:
-                return weight, self.history
+    min_distances = [float('inf')] * len(costs)
+    min_distances[source] = 0
+    heap = [(0, source)]
 
-            neighbors = [(y + dy, x + dx) for dx, dy in directions
-                         if 0 <= x + dx < self.width and 0 <= y + dy < self.height
-                         and self.maze[y + dy][x + dx] != GridCellType.BLOCK]
+    while heap:
+        weight, node = heapq.heappop(heap)
+        if weight > min_distances[node]:
+            continue
 
-            for n_y, n_x in neighbors:
-                g_val = min_distances[y, x] + g_n(g_y=n_y, g_x=n_x)
-                if g_val < min_distances[n_y, n_x]:
-                    min_distances[n_y, n_x] = g_val
-                    heapq.heappush(heap, (g_val, n_y, n_x))
+        for offset in offsets:
+            neighbor = node + offset
+            cost = costs[neighbor]
+            if cost:
+                g_val = weight + cost
+                if g_val < min_distances[neighbor]:
+                    min_distances[neighbor] = g_val
+                    heapq.heappush(heap, (g_val, neighbor))
 
-        return -1, self.history
+    return min_distances
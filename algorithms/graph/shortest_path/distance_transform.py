@@ -0,0 +1,87 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from algorithms.graph.utils import BucketQueue, CompiledGrid, GridCellType, compile_maze
+from algorithms.graph.utils.compiled_grid import GRID_CELL_CODES
+
+
+class DistanceTransform:
+    # Distance from every cell to its nearest source, by default the END cells, in one multi-source search.
+    # A cell's value is what Dijkstra returns with that cell as START and the nearest source as END: the cost of
+    # each cell stepped into, so the search runs backwards and leaving a cell costs that cell's own cost.
+    # Results are float32 (height, width) arrays with inf for BLOCK and unreachable cells.
+    def __init__(self, maze: List[List[GridCellType]] | CompiledGrid):
+        self.grid = compile_maze(maze)
+        self.height, self.width = self.grid.height, self.grid.width
+
+    def run(self, sources: Iterable[Tuple[int, int]] | None = None) -> np.ndarray:
+        costs = self.grid.costs.tolist()
+        offsets = self.grid.neighbor_offsets
+
+        min_distances = [float('inf')] * len(costs)
+        # Integer step costs make Dial's bucket queue exact
+        queue = BucketQueue(max_step=int(self.grid.costs.max()))
+        for source in self._source_indices(sources).tolist():
+            min_distances[source] = 0
+            queue.push(0, source)
+
+        while queue:
+            distance, node = queue.pop()
+            if distance > min_distances[node]:
+                continue
+
+            g_val = distance + costs[node]
+            for offset in offsets:
+                neighbor = node + offset
+                if costs[neighbor] and g_val < min_distances[neighbor]:
+                    min_distances[neighbor] = g_val
+                    queue.push(g_val, neighbor)
+
+        return self._to_cell_grid(np.array(min_distances, dtype=np.float32))
+
+    def run_wavefront(self, sources: Iterable[Tuple[int, int]] | None = None) -> np.ndarray:
+        # Same distances as run, settled one whole distance level at a time with array operations. Cells waiting
+        # at a level are kept per level; with unit costs this is a plain BFS frontier expansion.
+        costs = self.grid.costs
+        offsets = np.array(self.grid.neighbor_offsets)
+
+        min_distances = np.full(len(costs), np.inf, dtype=np.float32)
+        is_settled = np.zeros(len(costs), dtype=bool)
+        pending: Dict[int, List[np.ndarray]] = defaultdict(list)
+        pending[0].append(self._source_indices(sources))
+
+        while pending:
+            # Levels nothing is waiting at, such as the ones an OBSTACLE step jumps over, are skipped
+            distance = min(pending)
+            frontier = np.unique(np.concatenate(pending.pop(distance)))
+            frontier = frontier[~is_settled[frontier]]
+            if len(frontier):
+                is_settled[frontier] = True
+                min_distances[frontier] = distance
+
+                neighbors = frontier[:, None] + offsets[None, :]
+                can_enter = (costs[neighbors] > 0) & ~is_settled[neighbors]
+                step_costs = np.broadcast_to(costs[frontier][:, None], neighbors.shape)
+                for step_cost in np.unique(step_costs[can_enter]).tolist():
+                    pending[distance + step_cost].append(neighbors[can_enter & (step_costs == step_cost)])
+
+        return self._to_cell_grid(min_distances)
+
+    def _source_indices(self, sources: Iterable[Tuple[int, int]] | None) -> np.ndarray:
+        if sources is None:
+            return np.flatnonzero(self.grid.codes == GRID_CELL_CODES[GridCellType.END])
+
+        indices = []
+        for y, x in sources:
+            if not (0 <= y < self.height and 0 <= x < self.width):
+                raise ValueError(f"Source {(y, x)} is outside of the {self.height}x{self.width} maze")
+            index = self.grid.to_index(y, x)
+            if not self.grid.costs[index]:
+                raise ValueError(f"Source {(y, x)} is a BLOCK cell")
+            indices.append(index)
+        return np.array(indices, dtype=np.int64)
+
+    def _to_cell_grid(self, min_distances: np.ndarray) -> np.ndarray:
+        return min_distances.reshape(self.height + 2, self.grid.stride)[1:-1, 1:-1].copy()
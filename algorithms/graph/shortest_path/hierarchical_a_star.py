@@ -0,0 +1,240 @@
+import heapq
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+from algorithms.graph.utils import CompiledGrid, GridCellType, compile_maze
+from algorithms.graph.utils.history import HistoryLogger
+
+
+class ClusterGraph:
+    # Abstract graph of an HPA* style decomposition. The maze is cut into cluster_size x cluster_size chunks,
+    # every run of open cells across a chunk border becomes one or two entrances, and entrances inside the same
+    # chunk are linked with their in-chunk shortest distance. Built once, shared by any number of queries.
+    def __init__(self, grid: CompiledGrid, cluster_size: int = 16, max_single_entrance_width: int = 6):
+        if cluster_size < 2:
+            raise ValueError("cluster_size must be at least 2")
+
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.max_single_entrance_width = max_single_entrance_width
+        self._costs = grid.costs.tolist()
+
+        rows = np.arange(grid.height + 2)[:, None] - 1
+        cols = np.arange(grid.stride)[None, :] - 1
+        clusters_per_row = -(-grid.width // cluster_size)
+        cluster_ids = (rows // cluster_size) * clusters_per_row + cols // cluster_size
+        cluster_ids[0, :] = cluster_ids[-1, :] = cluster_ids[:, 0] = cluster_ids[:, -1] = -1
+        self.cluster_ids = cluster_ids.ravel().tolist()
+
+        self.nodes_by_cluster: Dict[int, List[int]] = defaultdict(list)
+        self.edges: Dict[int, Dict[int, int]] = defaultdict(dict)
+
+        self._build_entrances()
+        self._build_intra_cluster_edges()
+
+    def cluster_distances(self, source: int, reverse: bool = False) -> Dict[int, int]:
+        # Dijkstra limited to the source's cluster. With reverse=True the distances are from each cell to source.
+        costs, cluster_ids = self._costs, self.cluster_ids
+        offsets = self.grid.neighbor_offsets
+        cluster_id = cluster_ids[source]
+
+        min_distances = {source: 0}
+        heap = [(0, source)]
+        while heap:
+            distance, node = heapq.heappop(heap)
+            if distance > min_distances[node]:
+                continue
+
+            for offset in offsets:
+                neighbor = node + offset
+                if cluster_ids[neighbor] != cluster_id or not costs[neighbor]:
+                    continue
+                g_val = distance + (costs[node] if reverse else costs[neighbor])
+                if g_val < min_distances.get(neighbor, float('inf')):
+                    min_distances[neighbor] = g_val
+                    heapq.heappush(heap, (g_val, neighbor))
+
+        return min_distances
+
+    def _build_entrances(self):
+        grid, size = self.grid, self.cluster_size
+        cost_grid = grid.cost_grid()
+
+        # Borders between horizontally adjacent clusters, each pair of border columns read top to bottom
+        xs = np.arange(size - 1, grid.width - 1, size)
+        self._add_borders(is_open=((cost_grid[:, xs] > 0) & (cost_grid[:, xs + 1] > 0)).T, fixed=xs,
+                          offset=1, along_rows=True)
+
+        # Borders between vertically adjacent clusters, each pair of border rows read left to right
+        ys = np.arange(size - 1, grid.height - 1, size)
+        self._add_borders(is_open=(cost_grid[ys] > 0) & (cost_grid[ys + 1] > 0), fixed=ys,
+                          offset=grid.stride, along_rows=False)
+
+    def _add_borders(self, is_open: np.ndarray, fixed: np.ndarray, offset: int, along_rows: bool):
+        # is_open[b, i] tells whether both cells at position i of border b are open. Every border is cut into
+        # cluster_size long segments, each followed by a closed padding cell, so runs of open cells found in the
+        # flattened array never cross a segment.
+        size = self.cluster_size
+        num_borders, length = is_open.shape
+        if num_borders == 0:
+            return
+
+        num_segments = -(-length // size)
+        segments = np.zeros((num_borders, num_segments * size), dtype=bool)
+        segments[:, :length] = is_open
+        segments = np.pad(segments.reshape(num_borders, num_segments, size), ((0, 0), (0, 0), (0, 1)))
+
+        steps = np.diff(segments.ravel().astype(np.int8), prepend=0)
+        run_starts, run_ends = np.flatnonzero(steps == 1), np.flatnonzero(steps == -1)
+        run_lengths = run_ends - run_starts
+
+        is_single = run_lengths <= self.max_single_entrance_width
+        first = np.where(is_single, run_starts + run_lengths // 2, run_starts)
+        last = np.where(is_single, -1, run_ends - 1)
+        transitions = np.stack([first, last], axis=1).ravel()
+        transitions = transitions[transitions >= 0]
+
+        # Back from the padded layout to (border, position along the border) and to grid indices
+        border, rest = np.divmod(transitions, num_segments * (size + 1))
+        segment, position = np.divmod(rest, size + 1)
+        position += segment * size
+        if along_rows:
+            ys, xs = position, fixed[border]
+        else:
+            ys, xs = fixed[border], position
+
+        for inner in ((ys + 1) * self.grid.stride + xs + 1).tolist():
+            self._add_transition(inner=inner, outer=inner + offset)
+
+    def _add_transition(self, inner: int, outer: int):
+        for node in (inner, outer):
+            if node not in self.edges:
+                self.nodes_by_cluster[self.cluster_ids[node]].append(node)
+                self.edges[node] = {}
+
+        self.edges[inner][outer] = self._costs[outer]
+        self.edges[outer][inner] = self._costs[inner]
+
+    def _build_intra_cluster_edges(self, clusters_per_batch: int = 16):
+        # Cells are numbered cluster by cluster, so the graph of every in-cluster step is block diagonal and a
+        # run of consecutive clusters is one slice of it. Each slice is searched with a single scipy Dijkstra
+        # call from all of its entrances; paths never leave a cluster, so entrances of different clusters stay
+        # at infinite distance.
+        adjacency, cell_rank, cluster_starts = self._intra_cluster_adjacency()
+        cluster_ids = sorted(self.nodes_by_cluster)
+
+        for batch_start in range(0, len(cluster_ids), clusters_per_batch):
+            batch = cluster_ids[batch_start:batch_start + clusters_per_batch]
+            low, high = cluster_starts[batch[0]], cluster_starts[batch[-1] + 1]
+            nodes = [node for cluster_id in batch for node in self.nodes_by_cluster[cluster_id]]
+            sources = cell_rank[nodes] - low
+
+            min_distances = dijkstra(adjacency[low:high, low:high], directed=True, indices=sources)[:, sources]
+            np.fill_diagonal(min_distances, np.inf)
+            rows, cols = np.nonzero(np.isfinite(min_distances))
+            for i, j, distance in zip(rows.tolist(), cols.tolist(), min_distances[rows, cols].astype(int).tolist()):
+                node, other = nodes[i], nodes[j]
+                if distance < self.edges[node].get(other, float('inf')):
+                    self.edges[node][other] = distance
+
+    def _intra_cluster_adjacency(self) -> Tuple[csr_matrix, np.ndarray, np.ndarray]:
+        # Directed in-cluster steps weighted by the cost of the cell stepped into, over cells ranked by cluster.
+        # Also returns the rank of every padded grid index and where each cluster's ranks start.
+        costs = self.grid.costs
+        cluster_ids = np.asarray(self.cluster_ids)
+        cells = np.flatnonzero(cluster_ids >= 0)
+        order = cells[np.argsort(cluster_ids[cells], kind='stable')]
+
+        cell_rank = np.full(len(costs), -1)
+        cell_rank[order] = np.arange(len(order))
+        cluster_starts = np.searchsorted(cluster_ids[order], np.arange(cluster_ids.max() + 2))
+
+        sources, targets, weights = [], [], []
+        for offset in (1, self.grid.stride):
+            near = cells[cells + offset < len(costs)]
+            far = near + offset
+            steps = (cluster_ids[near] == cluster_ids[far]) & (costs[near] > 0) & (costs[far] > 0)
+            near, far = near[steps], far[steps]
+            sources += [cell_rank[near], cell_rank[far]]
+            targets += [cell_rank[far], cell_rank[near]]
+            weights += [costs[far], costs[near]]
+
+        adjacency = csr_matrix((np.concatenate(weights).astype(np.float64),
+                                (np.concatenate(sources), np.concatenate(targets))),
+                               shape=(len(order), len(order)))
+        return adjacency, cell_rank, cluster_starts
+
+
+class HierarchicalAStar:
+    # HPA* query over a ClusterGraph. Distances are those of real grid paths through cluster entrances, which
+    # are near optimal, not guaranteed shortest.
+    def __init__(self, maze: List[List[GridCellType]] | CompiledGrid, cluster_size: int = 16,
+                 cluster_graph: ClusterGraph | None = None, history: HistoryLogger | None = None):
+        self.grid = compile_maze(maze) if cluster_graph is None else cluster_graph.grid
+        self.height, self.width = self.grid.height, self.grid.width
+        self.history = history if history is not None else HistoryLogger()
+        self.history.bind_grid(self.grid.stride)
+
+        self.start_point = self.grid.start_point
+        self.goal_point = self.grid.goal_point
+
+        self.cluster_graph = cluster_graph or ClusterGraph(grid=self.grid, cluster_size=cluster_size)
+
+    def run(self, start_point: Tuple[int, int] | None = None,
+            goal_point: Tuple[int, int] | None = None) -> Tuple[int, HistoryLogger]:
+        start_point = start_point or self.start_point
+        goal_point = goal_point or self.goal_point
+        if start_point is None or goal_point is None:
+            raise ValueError("Maze must contain both a START and an END cell")
+
+        cluster_graph = self.cluster_graph
+        stride = self.grid.stride
+        to_coords = self.grid.to_coords
+        recording = self.history.is_recording
+        start, goal = self.grid.to_index(*start_point), self.grid.to_index(*goal_point)
+        y_e, x_e = divmod(goal, stride)
+
+        # Temporarily hook start and goal into the abstract graph through their own clusters
+        start_distances = cluster_graph.cluster_distances(source=start)
+        goal_distances = cluster_graph.cluster_distances(source=goal, reverse=True)
+        goal_cluster_nodes = {node: goal_distances[node]
+                              for node in cluster_graph.nodes_by_cluster.get(cluster_graph.cluster_ids[goal], [])
+                              if node in goal_distances}
+
+        min_distances = {start: 0}
+        heap = [(0, start)]
+        while heap:
+            key, node = heapq.heappop(heap)
+            node_distance = min_distances[node]
+            if key > node_distance + abs(node // stride - y_e) + abs(node % stride - x_e):
+                continue
+            if recording:
+                self.history.add_new_step(to_coords(node))
+
+            if node == goal:
+                return node_distance, self.history
+
+            if node == start:
+                edges = dict(cluster_graph.edges.get(start, {}))
+                start_cluster_nodes = cluster_graph.nodes_by_cluster.get(cluster_graph.cluster_ids[start], [])
+                edges.update({other: start_distances[other]
+                              for other in start_cluster_nodes if other in start_distances})
+                if goal in start_distances:
+                    edges[goal] = start_distances[goal]
+            else:
+                edges = dict(cluster_graph.edges.get(node, {}))
+                if node in goal_cluster_nodes:
+                    edges[goal] = goal_cluster_nodes[node]
+
+            for neighbor, weight in edges.items():
+                g_val = node_distance + weight
+                if g_val < min_distances.get(neighbor, float('inf')):
+                    min_distances[neighbor] = g_val
+                    h_val = abs(neighbor // stride - y_e) + abs(neighbor % stride - x_e)
+                    heapq.heappush(heap, (g_val + h_val, neighbor))
+
+        return -1, self.history
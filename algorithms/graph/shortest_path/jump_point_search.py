@@ -0,0 +1,147 @@
+import heapq
+from array import array
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from algorithms.graph.utils import CompiledGrid, GridCellType, compile_maze
+from algorithms.graph.utils.history import HistoryLogger
+
+
+class JumpPointSearch:
+    # Four-connected Jump Point Search. Runs of OPEN_PATH cells (cost 1) are skipped in straight lines, and any
+    # cell with a different cost (OBSTACLE) stops a jump and is expanded like a regular A* node, so the result
+    # is the same shortest distance that Dijkstra and AStar return. Where a jump in each direction stops is
+    # precomputed once per run with NumPy, so a jump is a table lookup however cluttered the map is.
+    def __init__(self, maze: List[List[GridCellType]] | CompiledGrid, history: HistoryLogger | None = None):
+        self.grid = compile_maze(maze)
+        self.height, self.width = self.grid.height, self.grid.width
+        self.history = history if history is not None else HistoryLogger()
+        self.history.bind_grid(self.grid.stride)
+
+        self.start_point = self.grid.start_point
+        self.goal_point = self.grid.goal_point
+
+        # Exit tables are kept between runs until a cell of the grid changes
+        self._exits: Dict[int, array] = {}
+        self._exits_codes: np.ndarray | None = None
+
+    def run(self) -> Tuple[int, HistoryLogger]:
+        if self.grid.start is None or self.grid.goal is None:
+            raise ValueError("Maze must contain both a START and an END cell")
+
+        start, goal = self.grid.start, self.grid.goal
+        stride = self.grid.stride
+        to_coords = self.grid.to_coords
+        recording = self.history.is_recording
+        costs = self.grid.costs.tolist()
+        exits = self._jump_exit_tables()
+
+        # Directions worth scanning from a cost 1 jump point entered in a direction: straight on and both turns
+        all_directions = self.grid.neighbor_offsets
+        pruned_directions = {1: (1, stride, -stride), -1: (-1, stride, -stride),
+                             stride: (stride, 1, -1), -stride: (-stride, 1, -1)}
+
+        y_e, x_e = divmod(goal, stride)
+
+        inf = float('inf')
+        min_distances = {start: 0}
+        # Direction each jump point was entered with, 0 for nodes whose every neighbor must be scanned
+        directions = {start: 0}
+        heap = [(abs(start // stride - y_e) + abs(start % stride - x_e), start)]
+
+        while heap:
+            key, node = heapq.heappop(heap)
+            node_distance = min_distances[node]
+            if key > node_distance + abs(node // stride - y_e) + abs(node % stride - x_e):
+                continue
+            if recording:
+                self.history.add_new_step(to_coords(node))
+
+            if node == goal:
+                return node_distance, self.history
+
+            direction = directions[node]
+            for next_direction in (all_directions if direction == 0 or costs[node] != 1
+                                   else pruned_directions[direction]):
+                jump_point = exits[next_direction][node]
+                if jump_point < 0:
+                    continue
+
+                steps = abs(jump_point - node)
+                if next_direction not in (1, -1):
+                    steps //= stride
+                # Every cell passed on the way costs 1, only the jump point itself may be more expensive
+                g_val = node_distance + steps - 1 + costs[jump_point]
+                if g_val < min_distances.get(jump_point, inf):
+                    min_distances[jump_point] = g_val
+                    directions[jump_point] = next_direction
+                    h_val = abs(jump_point // stride - y_e) + abs(jump_point % stride - x_e)
+                    heapq.heappush(heap, (g_val + h_val, jump_point))
+
+        return -1, self.history
+
+    def _jump_exit_tables(self) -> Dict[int, array]:
+        if self._exits_codes is None or not np.array_equal(self._exits_codes, self.grid.codes):
+            self._exits = self._build_jump_exit_tables()
+            self._exits_codes = self.grid.codes.copy()
+        return self._exits
+
+    def _build_jump_exit_tables(self) -> Dict[int, array]:
+        # For every direction and cell, where a jump from the cell stops: the first cell on the way that is the
+        # goal, costs more than 1, has a forced neighbor or, for vertical jumps, starts a successful horizontal
+        # jump. -1 when a blocked cell comes first. The tables are int32 arrays, 4 bytes per cell each, whose
+        # items still come back as plain ints in the search loop.
+        costs, stride, goal = self.grid.costs.astype(np.int64), self.grid.stride, self.grid.goal
+
+        def shifted(offset: int) -> np.ndarray:
+            # shifted(offset)[i] = costs[i + offset], blocked outside of the padded grid
+            result = np.zeros(len(costs), dtype=np.int64)
+            if offset > 0:
+                result[:len(costs) - offset] = costs[offset:]
+            else:
+                result[-offset:] = costs[:len(costs) + offset]
+            return result
+
+        def stop_mask(direction: int, sides: Tuple[int, int]) -> np.ndarray:
+            is_stop = costs != 1
+            for side in sides:
+                is_stop |= (shifted(side) != 0) & (shifted(side - direction) != 1)
+            is_stop[goal] = True
+            return is_stop
+
+        horizontal = {direction: self._exit_table(stop_mask(direction, (stride, -stride)), direction, costs)
+                      for direction in (1, -1)}
+        can_turn = (horizontal[1] >= 0) | (horizontal[-1] >= 0)
+        vertical = {direction: self._exit_table(stop_mask(direction, (1, -1)) | can_turn, direction, costs)
+                    for direction in (stride, -stride)}
+        return {direction: array('i', table.astype(np.int32).tobytes())
+                for direction, table in (horizontal | vertical).items()}
+
+    def _exit_table(self, is_stop: np.ndarray, direction: int, costs: np.ndarray) -> np.ndarray:
+        # Nearest stopping cell strictly after each cell in direction. Blocked cells always stop and the padded
+        # border is blocked, so every row and column has one before the edge of the array.
+        rows, stride = self.height + 2, self.grid.stride
+        indices = np.arange(len(costs)).reshape(rows, stride)
+        is_stop = is_stop.reshape(rows, stride)
+        axis = 1 if direction in (1, -1) else 0
+
+        if direction > 0:
+            nearest = np.flip(np.minimum.accumulate(np.flip(np.where(is_stop, indices, len(costs)), axis), axis), axis)
+            exits = np.full((rows, stride), -1)
+            if axis:
+                exits[:, :-1] = nearest[:, 1:]
+            else:
+                exits[:-1] = nearest[1:]
+        else:
+            nearest = np.maximum.accumulate(np.where(is_stop, indices, -1), axis)
+            exits = np.full((rows, stride), -1)
+            if axis:
+                exits[:, 1:] = nearest[:, :-1]
+            else:
+                exits[1:] = nearest[:-1]
+
+        exits = exits.ravel()
+        exits[(exits >= len(costs)) | (exits < 0)] = -1
+        exits[costs[exits] == 0] = -1
+        return exits
@@ -0,0 +1,138 @@
+import heapq
+from typing import Dict, Iterable, List, Tuple
+
+from algorithms.graph.utils import CompiledGrid, GridCellType, compile_maze
+from algorithms.graph.utils.history import HistoryLogger
+
+CHANGEABLE_CELL_TYPES = (GridCellType.OPEN_PATH, GridCellType.BLOCK, GridCellType.OBSTACLE)
+
+
+class LifelongPlanningAStar:
+    # LPA*: keeps g / rhs values and the open queue between runs, so after update_cells only the vertices whose
+    # shortest distance actually changed are expanded again.
+    def __init__(self, maze: List[List[GridCellType]] | CompiledGrid, history: HistoryLogger | None = None):
+        self.grid = compile_maze(maze)
+        self.height, self.width = self.grid.height, self.grid.width
+        self.history = history if history is not None else HistoryLogger()
+        self.history.bind_grid(self.grid.stride)
+
+        self.start_point = self.grid.start_point
+        self.goal_point = self.grid.goal_point
+        if self.grid.start is None or self.grid.goal is None:
+            raise ValueError("Maze must contain both a START and an END cell")
+
+        self._costs = self.grid.costs.tolist()
+        self._g = [float('inf')] * len(self._costs)
+        self._rhs = [float('inf')] * len(self._costs)
+        self._rhs[self.grid.start] = 0
+
+        self._heap = []
+        self._queue_keys: Dict[int, Tuple[float, float]] = {}
+        self._insert(self.grid.start)
+
+    # The caller's history logger is cleared and refilled in place, so it holds the expansions of the latest run
+    def run(self) -> Tuple[int, HistoryLogger]:
+        self.history.clear()
+        self._compute_shortest_path()
+
+        goal_distance = self._g[self.grid.goal]
+        return (-1 if goal_distance == float('inf') else goal_distance), self.history
+
+    def update_cells(self, changes: Iterable[Tuple[int, int, GridCellType]]):
+        # The whole batch is validated before any cell changes, so a rejected batch leaves the planner untouched
+        changes = list(changes)
+        for y, x, cell_type in changes:
+            if not (0 <= y < self.height and 0 <= x < self.width):
+                raise ValueError(f"Cell {(y, x)} is outside of the {self.height}x{self.width} maze")
+            if cell_type not in CHANGEABLE_CELL_TYPES:
+                raise ValueError(f"Cells can only change to one of {[str(t) for t in CHANGEABLE_CELL_TYPES]}")
+            if self.grid.to_index(y, x) in (self.grid.start, self.grid.goal):
+                raise ValueError("START and END cells cannot be changed")
+
+        changed = []
+        for y, x, cell_type in changes:
+            index = self.grid.to_index(y, x)
+            self.grid.set_cell(y=y, x=x, cell_type=cell_type)
+            self._costs[index] = int(self.grid.costs[index])
+            changed.append(index)
+
+        # A cell's cost is paid on every edge into it, and blocking it also removes every edge out of it
+        affected = set(changed)
+        for index in changed:
+            affected.update(index + offset for offset in self.grid.neighbor_offsets)
+        for index in affected:
+            self._update_vertex(index)
+
+    def _heuristic(self, node: int) -> int:
+        stride = self.grid.stride
+        y, x = divmod(node, stride)
+        y_e, x_e = divmod(self.grid.goal, stride)
+        return abs(y - y_e) + abs(x - x_e)
+
+    def _calculate_key(self, node: int) -> Tuple[float, float]:
+        distance = min(self._g[node], self._rhs[node])
+        return distance + self._heuristic(node), distance
+
+    def _insert(self, node: int):
+        key = self._calculate_key(node)
+        self._queue_keys[node] = key
+        heapq.heappush(self._heap, (key, node))
+
+    def _top(self) -> Tuple[Tuple[float, float], int] | None:
+        # Entries whose node was removed or re-keyed since they were pushed are dropped lazily
+        while self._heap:
+            key, node = self._heap[0]
+            if self._queue_keys.get(node) == key:
+                return key, node
+            heapq.heappop(self._heap)
+        return None
+
+    def _update_vertex(self, node: int):
+        costs = self._costs
+        if node != self.grid.start:
+            cost = costs[node]
+            if cost:
+                g = self._g
+                best = float('inf')
+                for offset in self.grid.neighbor_offsets:
+                    predecessor = node + offset
+                    if costs[predecessor] or predecessor == self.grid.start:
+                        best = min(best, g[predecessor])
+                self._rhs[node] = best + cost
+            else:
+                self._rhs[node] = float('inf')
+
+        self._queue_keys.pop(node, None)
+        if self._g[node] != self._rhs[node]:
+            self._insert(node)
+
+    def _compute_shortest_path(self):
+        goal = self.grid.goal
+        g, rhs = self._g, self._rhs
+        offsets = self.grid.neighbor_offsets
+        to_coords = self.grid.to_coords
+        recording = self.history.is_recording
+
+        while True:
+            top = self._top()
+            if top is None:
+                return
+            key, node = top
+            if key >= self._calculate_key(goal) and rhs[goal] == g[goal]:
+                return
+
+            heapq.heappop(self._heap)
+            del self._queue_keys[node]
+            if recording:
+                self.history.add_new_step(to_coords(node))
+
+            if g[node] > rhs[node]:
+                g[node] = rhs[node]
+                successors = [node + offset for offset in offsets]
+            else:
+                g[node] = float('inf')
+                successors = [node] + [node + offset for offset in offsets]
+
+            for successor in successors:
+                if self._costs[successor] or successor == node:
+                    self._update_vertex(successor)
@@ -4,3 +4,8 @@ from enum import StrEnum
 class ShortestPathMethod(StrEnum):
     DIJKSTRA = 'dijkstra'
     A_STAR = 'a_star'
+    BIDIRECTIONAL_DIJKSTRA = 'bidirectional_dijkstra'
+    BIDIRECTIONAL_A_STAR = 'bidirectional_a_star'
+    JUMP_POINT_SEARCH = 'jump_point_search'
+    HIERARCHICAL_A_STAR = 'hierarchical_a_star'
+    LIFELONG_PLANNING_A_STAR = 'lifelong_planning_a_star'
@@ -0,0 +1,83 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+from algorithms.graph.shortest_path.dijkstra import compute_distance_field
+from algorithms.graph.utils import CompiledGrid, GridCellType, compile_maze
+
+UNREACHABLE = -1
+
+
+@dataclass
+class CacheInfo:
+    hits: int
+    misses: int
+    max_size: int
+    current_size: int
+
+
+class ShortestPathQuery:
+    def __init__(self, maze: List[List[GridCellType]] | CompiledGrid, max_cached_sources: int = 16):
+        if max_cached_sources < 1:
+            raise ValueError("max_cached_sources must be at least 1")
+
+        self.grid = compile_maze(maze)
+        self.height, self.width = self.grid.height, self.grid.width
+        self.max_cached_sources = max_cached_sources
+
+        # Least recently used source first, distance fields stored as int32 with UNREACHABLE for inf
+        self._distance_fields: OrderedDict[int, np.ndarray] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def run(self, start_point: Tuple[int, int], goal_point: Tuple[int, int]) -> int:
+        distance_field = self._get_distance_field(source=self._to_source_index(start_point))
+        return int(distance_field[self._to_index(goal_point)])
+
+    def run_many(self, queries: Iterable[Tuple[Tuple[int, int], Tuple[int, int]]]) -> List[int]:
+        return [self.run(start_point=start_point, goal_point=goal_point) for start_point, goal_point in queries]
+
+    def get_distance_field(self, start_point: Tuple[int, int]) -> np.ndarray:
+        distance_field = self._get_distance_field(source=self._to_source_index(start_point))
+        return distance_field.reshape(self.height + 2, self.grid.stride)[1:-1, 1:-1]
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(hits=self.hits, misses=self.misses,
+                         max_size=self.max_cached_sources, current_size=len(self._distance_fields))
+
+    def cache_clear(self):
+        self._distance_fields.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _get_distance_field(self, source: int) -> np.ndarray:
+        distance_field = self._distance_fields.get(source)
+        if distance_field is not None:
+            self.hits += 1
+            self._distance_fields.move_to_end(source)
+            return distance_field
+
+        self.misses += 1
+        min_distances = np.array(compute_distance_field(grid=self.grid, source=source))
+        min_distances[np.isinf(min_distances)] = UNREACHABLE
+        distance_field = min_distances.astype(np.int32)
+
+        self._distance_fields[source] = distance_field
+        if len(self._distance_fields) > self.max_cached_sources:
+            self._distance_fields.popitem(last=False)
+
+        return distance_field
+
+    def _to_index(self, point: Tuple[int, int]) -> int:
+        y, x = point
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            raise ValueError(f"Point {point} is outside of the {self.height}x{self.width} maze")
+        return self.grid.to_index(y, x)
+
+    def _to_source_index(self, point: Tuple[int, int]) -> int:
+        index = self._to_index(point)
+        if not self.grid.costs[index]:
+            raise ValueError(f"Start point {point} is a BLOCK cell")
+        return index
@@ -1,4 +1,10 @@
 from .definitions import GridCellType
 
-from .history import HistoryLogger
-from .utils import grid_to_graph, graph_to_grid, graph_to_edge_list, edge_list_to_graph, find_char_location
+from .history import HistoryLogger, HistoryMode
+from .utils import (grid_to_graph, graph_to_grid, graph_to_edge_list, edge_list_to_graph, find_char_location,
+                    grid_to_edge_arrays)
+from .compiled_grid import CompiledGrid, compile_maze
+from .history_stream import encode_history_chunks, write_history_stream, read_history_stream
+from .csr_graph import CSRGraph, as_csr_graph
+from .union_find import UnionFind
+from .priority_queue import PriorityQueueType, IndexedMinHeap, BucketQueue
@@ -0,0 +1,79 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from .definitions import GridCellType
+
+GRID_CELL_CODES = {
+    GridCellType.OPEN_PATH: 0,
+    GridCellType.BLOCK: 1,
+    GridCellType.OBSTACLE: 2,
+    GridCellType.START: 3,
+    GridCellType.END: 4,
+}
+
+# Cost of stepping into a cell, indexed by cell code. Zero marks a cell that cannot be entered.
+CELL_COST_BY_CODE = np.array([1, 0, 4, 1, 1], dtype=np.uint8)
+
+
+class CompiledGrid:
+    # Cell codes and step costs live in flat uint8 arrays over the maze padded with a one cell BLOCK
+    # border, so neighbor probes are plain index offsets and never need a bounds check.
+    def __init__(self, codes: np.ndarray):
+        self.height, self.width = codes.shape
+        self.stride = self.width + 2
+
+        padded = np.full((self.height + 2, self.stride), GRID_CELL_CODES[GridCellType.BLOCK], dtype=np.uint8)
+        padded[1:-1, 1:-1] = codes
+        self.codes = padded.ravel()
+        self.costs = CELL_COST_BY_CODE[self.codes]
+
+        # Same probe order as the original (dy, dx) walk: down, up, right, left
+        self.neighbor_offsets = (self.stride, -self.stride, 1, -1)
+
+        self.start = self._find_first(GridCellType.START)
+        self.goal = self._find_first(GridCellType.END)
+
+    @classmethod
+    def from_maze(cls, maze: List[List[GridCellType]]) -> 'CompiledGrid':
+        cells = np.asarray(maze, dtype=str)
+        codes = np.zeros(cells.shape, dtype=np.uint8)
+        for cell_type, code in GRID_CELL_CODES.items():
+            codes[cells == cell_type.value] = code
+        return cls(codes=codes)
+
+    @property
+    def size(self) -> int:
+        return len(self.codes)
+
+    @property
+    def start_point(self) -> Tuple[int, int] | None:
+        return None if self.start is None else self.to_coords(self.start)
+
+    @property
+    def goal_point(self) -> Tuple[int, int] | None:
+        return None if self.goal is None else self.to_coords(self.goal)
+
+    def to_index(self, y: int, x: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    def to_coords(self, index: int) -> Tuple[int, int]:
+        y, x = divmod(index, self.stride)
+        return y - 1, x - 1
+
+    def set_cell(self, y: int, x: int, cell_type: GridCellType):
+        index = self.to_index(y, x)
+        code = GRID_CELL_CODES[cell_type]
+        self.codes[index] = code
+        self.costs[index] = CELL_COST_BY_CODE[code]
+
+    def cost_grid(self) -> np.ndarray:
+        return self.costs.reshape(self.height + 2, self.stride)[1:-1, 1:-1]
+
+    def _find_first(self, cell_type: GridCellType) -> int | None:
+        indices = np.flatnonzero(self.codes == GRID_CELL_CODES[cell_type])
+        return int(indices[0]) if len(indices) else None
+
+
+def compile_maze(maze: List[List[GridCellType]] | CompiledGrid) -> CompiledGrid:
+    return maze if isinstance(maze, CompiledGrid) else CompiledGrid.from_maze(maze)
@@ -0,0 +1,157 @@
+from typing import Any, Dict, List, Tuple
+
+import networkx as nx
+import numpy as np
+
+from .compiled_grid import CompiledGrid, compile_maze
+from .definitions import GridCellType
+
+
+class CSRGraph:
+    # Compressed sparse row adjacency: the out-edges of node id i are indices[indptr[i]:indptr[i + 1]] with the
+    # matching weights. Undirected graphs store every edge in both directions. nodes maps ids back to labels.
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray, nodes: List[Any],
+                 directed: bool = False):
+        if len(indptr) != len(nodes) + 1:
+            raise ValueError("indptr must have one entry more than there are nodes")
+        if len(indices) != len(weights) or len(indices) != indptr[-1]:
+            raise ValueError("indices and weights must both hold indptr[-1] entries")
+
+        self.indptr = np.asarray(indptr, dtype=np.int32)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        # Numeric weights keep their dtype; anything else, such as the GridCellType weights grid_to_graph stores,
+        # is kept as Python objects
+        self.weights = np.asarray(weights)
+        if self.weights.dtype.kind not in 'iufO':
+            self.weights = self.weights.astype(object)
+        self.nodes = list(nodes)
+        self.node_index: Dict[Any, int] = {node: i for i, node in enumerate(self.nodes)}
+        self.directed = directed
+
+    @classmethod
+    def from_adjacency(cls, adjacency: Dict[Any, Dict[Any, float]], directed: bool = False) -> 'CSRGraph':
+        nodes = list(adjacency)
+        node_index = {node: i for i, node in enumerate(nodes)}
+
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int32)
+        indptr[1:] = np.cumsum([len(neighbors) for neighbors in adjacency.values()])
+        indices = [node_index[neighbor] for neighbors in adjacency.values() for neighbor in neighbors]
+        weights = [weight for neighbors in adjacency.values() for weight in neighbors.values()]
+
+        return cls(indptr=indptr, indices=np.array(indices, dtype=np.int32), weights=_weight_array(weights),
+                   nodes=nodes, directed=directed)
+
+    @classmethod
+    def from_networkx(cls, graph: nx.Graph, weight: str | None = 'weight', default_weight: float = 1.0) -> 'CSRGraph':
+        # Neighbor order follows graph.adj, so traversals visit nodes in the same order as on the networkx graph.
+        # weight=None ignores edge data and gives every edge default_weight.
+        adjacency = graph.adj
+        nodes = list(adjacency)
+        node_index = {node: i for i, node in enumerate(nodes)}
+
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int32)
+        indptr[1:] = np.cumsum(np.fromiter(map(len, adjacency.values()), dtype=np.int32, count=len(nodes)))
+        num_entries = int(indptr[-1])
+
+        indices = np.fromiter((node_index[neighbor] for neighbors in adjacency.values() for neighbor in neighbors),
+                              dtype=np.int32, count=num_entries)
+        if weight is None:
+            weights = np.full(num_entries, default_weight, dtype=np.float64)
+        else:
+            weights = _weight_array([data.get(weight, default_weight)
+                                     for neighbors in adjacency.values() for data in neighbors.values()])
+
+        return cls(indptr=indptr, indices=indices, weights=weights, nodes=nodes, directed=graph.is_directed())
+
+    @classmethod
+    def from_edge_list(cls, input_data: List[Tuple[Any, Any, float]], directed: bool = False) -> 'CSRGraph':
+        # Same (u, v, weight) input as edge_list_to_graph, with the same node and neighbor order
+        adjacency: Dict[Any, Dict[Any, float]] = {}
+        for u, v, weight in input_data:
+            adjacency.setdefault(u, {})[v] = weight
+            neighbors_of_v = adjacency.setdefault(v, {})
+            if not directed:
+                neighbors_of_v[u] = weight
+        return cls.from_adjacency(adjacency=adjacency, directed=directed)
+
+    @classmethod
+    def from_grid(cls, maze: List[List[GridCellType]] | CompiledGrid) -> 'CSRGraph':
+        # Every non BLOCK cell is a (row, col) node. Edges follow the grid solvers: stepping into a cell costs
+        # that cell's cost, so the graph is directed. Built straight from the compiled cost array.
+        grid = compile_maze(maze)
+        costs = grid.costs
+
+        cells = np.flatnonzero(costs)
+        node_ids = np.full(len(costs), -1, dtype=np.int32)
+        node_ids[cells] = np.arange(len(cells), dtype=np.int32)
+
+        neighbors = cells[:, None] + np.array(grid.neighbor_offsets)[None, :]
+        is_edge = costs[neighbors] > 0
+
+        indptr = np.zeros(len(cells) + 1, dtype=np.int32)
+        indptr[1:] = np.cumsum(np.count_nonzero(is_edge, axis=1))
+
+        node_rows, node_cols = np.divmod(cells, grid.stride)
+        nodes = list(zip((node_rows - 1).tolist(), (node_cols - 1).tolist()))
+
+        return cls(indptr=indptr, indices=node_ids[neighbors[is_edge]], weights=costs[neighbors[is_edge]],
+                   nodes=nodes, directed=True)
+
+    @classmethod
+    def from_edge_arrays(cls, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray, num_nodes: int,
+                         nodes: List[Any] | None = None, directed: bool = False) -> 'CSRGraph':
+        # Bulk load from int id arrays, e.g. grid_to_edge_arrays output. Each source keeps its edges in input order.
+        if not directed:
+            sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+            weights = np.concatenate([weights, weights])
+
+        order = np.argsort(sources, kind='stable')
+        indptr = np.zeros(num_nodes + 1, dtype=np.int32)
+        indptr[1:] = np.cumsum(np.bincount(sources, minlength=num_nodes))
+
+        return cls(indptr=indptr, indices=targets[order], weights=np.asarray(weights)[order],
+                   nodes=list(range(num_nodes)) if nodes is None else nodes, directed=directed)
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def num_edges(self) -> int:
+        return int(self.indptr[-1]) if self.directed else int(self.indptr[-1] + self._num_self_loops()) // 2
+
+    def __contains__(self, node: Any) -> bool:
+        return node in self.node_index
+
+    def neighbors(self, node: Any) -> List[Any]:
+        i = self.node_index[node]
+        return [self.nodes[j] for j in self.indices[self.indptr[i]:self.indptr[i + 1]].tolist()]
+
+    def to_edge_list(self) -> List[Tuple[float, Any, Any]]:
+        # Same (weight, u, v) layout as graph_to_edge_list, each undirected edge listed once
+        sources = np.repeat(np.arange(self.num_nodes, dtype=np.int32), np.diff(self.indptr))
+        keep = np.ones(len(self.indices), dtype=bool) if self.directed else sources <= self.indices
+        nodes = self.nodes
+        return [(weight, nodes[u], nodes[v]) for weight, u, v in
+                zip(self.weights[keep].tolist(), sources[keep].tolist(), self.indices[keep].tolist())]
+
+    def _num_self_loops(self) -> int:
+        sources = np.repeat(np.arange(self.num_nodes, dtype=np.int32), np.diff(self.indptr))
+        return int(np.count_nonzero(sources == self.indices))
+
+
+def _weight_array(weights: List[Any]) -> np.ndarray:
+    # Edge weights as given, so tolist() hands back the same values: all int weights stay int64, all float weights
+    # float64, and any other mix stays an object array
+    if all(isinstance(weight, (int, np.integer)) and not isinstance(weight, bool) for weight in weights):
+        return np.array(weights, dtype=np.int64)
+    if all(isinstance(weight, (float, np.floating)) for weight in weights):
+        return np.array(weights, dtype=np.float64)
+
+    result = np.empty(len(weights), dtype=object)
+    result[:] = weights
+    return result
+
+
+def as_csr_graph(graph: nx.Graph | CSRGraph, weight: str | None = 'weight') -> CSRGraph:
+    return graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx(graph, weight=weight)
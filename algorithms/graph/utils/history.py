@@ -1,11 +1,113 @@
-from typing import Any
+from collections import deque
+from enum import StrEnum
+from typing import Any, Dict, Generator
+
+import numpy as np
+
+
+class HistoryMode(StrEnum):
+    FULL = 'full'
+    OFF = 'off'
+    SAMPLED = 'sampled'
+    RING_BUFFER = 'ring_buffer'
+    COMPACT = 'compact'
 
 
 class HistoryLogger:
-    def __init__(self):
+    def __init__(self, mode: HistoryMode = HistoryMode.FULL, sample_every: int = 1, capacity: int = 10000):
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.mode = mode
+        self.sample_every = sample_every
+        self.capacity = capacity
         self.step = 0
-        self.history_dict = {}
+
+        # Algorithms check this once per run and skip add_new_step entirely when nothing is recorded
+        self.is_recording = mode != HistoryMode.OFF
+
+        self._history_dict = {}
+        self._ring_buffer = deque(maxlen=capacity)
+        # COMPACT keeps one int32 per step in a growable array: the flat CompiledGrid index of a (row, col) node
+        # once a grid is bound, decoded back to (row, col) only when the history is read. Without a grid, every
+        # distinct node is stored once and the array holds its id.
+        self._grid_stride = None
+        self._codes = np.empty(1024, dtype=np.int32)
+        self._nodes = []
+        self._node_index = {}
+
+        if mode == HistoryMode.OFF:
+            self.add_new_step = self._skip_step
+        elif mode == HistoryMode.SAMPLED:
+            self.add_new_step = self._add_sampled_step
+        elif mode == HistoryMode.RING_BUFFER:
+            self.add_new_step = self._add_ring_buffer_step
+        elif mode == HistoryMode.COMPACT:
+            self.add_new_step = self._add_compact_step
 
     def add_new_step(self, node: Any, data: Any | None = None):
-        self.history_dict[self.step] = (node, data) if data else node
+        self._history_dict[self.step] = (node, data) if data else node
+        self.step += 1
+
+    @property
+    def history_dict(self) -> Dict[int, Any]:
+        if self.mode == HistoryMode.RING_BUFFER:
+            return dict(self._ring_buffer)
+        if self.mode == HistoryMode.COMPACT:
+            codes = self._codes[:self.step]
+            if self._grid_stride is not None:
+                rows, cols = np.divmod(codes, self._grid_stride)
+                return dict(enumerate(zip((rows - 1).tolist(), (cols - 1).tolist())))
+            nodes = self._nodes
+            return {step: nodes[node_id] for step, node_id in enumerate(codes.tolist())}
+        return self._history_dict
+
+    def bind_grid(self, stride: int):
+        # Called by grid algorithms before recording, with their CompiledGrid stride
+        self._grid_stride = stride
+
+    def record_steps(self, steps: Generator) -> Any:
+        # Drains a step generator into the log and hands back whatever the generator returned
+        add_new_step = self.add_new_step
+        while True:
+            try:
+                node = next(steps)
+            except StopIteration as stop:
+                return stop.value
+            add_new_step(node)
+
+    def clear(self):
+        # Drops every recorded step but keeps the mode and the bound grid, for algorithms that log run after run
+        self.step = 0
+        self._history_dict.clear()
+        self._ring_buffer.clear()
+        self._nodes.clear()
+        self._node_index.clear()
+
+    def _skip_step(self, node: Any, data: Any | None = None):
+        pass
+
+    def _add_sampled_step(self, node: Any, data: Any | None = None):
+        if self.step % self.sample_every == 0:
+            self._history_dict[self.step] = (node, data) if data else node
+        self.step += 1
+
+    def _add_ring_buffer_step(self, node: Any, data: Any | None = None):
+        self._ring_buffer.append((self.step, (node, data) if data else node))
+        self.step += 1
+
+    def _add_compact_step(self, node: Any, data: Any | None = None):
+        if self._grid_stride is not None:
+            code = (node[0] + 1) * self._grid_stride + node[1] + 1
+        else:
+            code = self._node_index.get(node)
+            if code is None:
+                code = self._node_index[node] = len(self._nodes)
+                self._nodes.append(node)
+
+        if self.step == len(self._codes):
+            self._codes = np.resize(self._codes, 2 * len(self._codes))
+        self._codes[self.step] = code
         self.step += 1
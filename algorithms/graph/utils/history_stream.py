@@ -0,0 +1,76 @@
+import struct
+from itertools import islice
+from typing import Any, BinaryIO, Iterable, Iterator, List
+
+import numpy as np
+
+# Stream layout: STREAM_HEADER once, then any number of chunks. Each chunk is a CHUNK_HEADER (node kind, step
+# count) followed by the nodes as little endian int64, one value per INT node or a (row, col) pair per GRID node.
+STREAM_MAGIC = b'LNBH'
+STREAM_VERSION = 1
+STREAM_HEADER = struct.Struct('<4sB')
+CHUNK_HEADER = struct.Struct('<BI')
+
+INT_NODE_KIND = 1
+GRID_NODE_KIND = 2
+
+
+def encode_history_chunks(steps: Iterable[Any], chunk_size: int = 4096) -> Iterator[bytes]:
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    yield STREAM_HEADER.pack(STREAM_MAGIC, STREAM_VERSION)
+
+    steps = iter(steps)
+    while True:
+        chunk = list(islice(steps, chunk_size))
+        if not chunk:
+            return
+
+        # A chunk holds a single node kind, so a kind change splits it
+        start = 0
+        for i in range(1, len(chunk) + 1):
+            if i == len(chunk) or _node_kind(chunk[i]) != _node_kind(chunk[start]):
+                yield _encode_chunk(chunk[start:i])
+                start = i
+
+
+def write_history_stream(steps: Iterable[Any], file: BinaryIO, chunk_size: int = 4096) -> int:
+    num_bytes = 0
+    for encoded_chunk in encode_history_chunks(steps=steps, chunk_size=chunk_size):
+        file.write(encoded_chunk)
+        num_bytes += len(encoded_chunk)
+    return num_bytes
+
+
+def read_history_stream(file: BinaryIO) -> Iterator[Any]:
+    header = file.read(STREAM_HEADER.size)
+    magic, version = STREAM_HEADER.unpack(header)
+    if magic != STREAM_MAGIC or version != STREAM_VERSION:
+        raise ValueError("Not a history stream, or written by an unsupported version")
+
+    while True:
+        chunk_header = file.read(CHUNK_HEADER.size)
+        if not chunk_header:
+            return
+        kind, count = CHUNK_HEADER.unpack(chunk_header)
+
+        values_per_node = 2 if kind == GRID_NODE_KIND else 1
+        values = np.frombuffer(file.read(8 * values_per_node * count), dtype='<i8')
+        if kind == GRID_NODE_KIND:
+            yield from (tuple(pair) for pair in values.reshape(count, 2).tolist())
+        else:
+            yield from values.tolist()
+
+
+def _node_kind(node: Any) -> int:
+    if isinstance(node, (int, np.integer)):
+        return INT_NODE_KIND
+    if isinstance(node, tuple) and len(node) == 2 and all(isinstance(v, (int, np.integer)) for v in node):
+        return GRID_NODE_KIND
+    raise TypeError(f"Only int and (row, col) nodes can be serialized, got {node!r}")
+
+
+def _encode_chunk(nodes: List[Any]) -> bytes:
+    values = np.asarray(nodes, dtype='<i8')
+    return CHUNK_HEADER.pack(_node_kind(nodes[0]), len(nodes)) + values.tobytes()
@@ -0,0 +1,123 @@
+from enum import StrEnum
+from typing import List, Tuple
+
+
+class PriorityQueueType(StrEnum):
+    BINARY_HEAP = 'binary_heap'
+    INDEXED_HEAP = 'indexed_heap'
+    BUCKET = 'bucket'
+
+
+class IndexedMinHeap:
+    # Binary heap over int ids 0..capacity-1 with at most one entry per id. Pushing an id that is already queued
+    # with a smaller key is a decrease-key that moves the entry, so no stale copies pile up. Equal keys pop in id
+    # order, the same order a lazy heapq of (key, id) tuples settles them in.
+    def __init__(self, capacity: int):
+        self.keys: List[float] = [0] * capacity
+        self.position: List[int] = [-1] * capacity
+        self.heap: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __contains__(self, item: int) -> bool:
+        return self.position[item] >= 0
+
+    def key(self, item: int) -> float:
+        return self.keys[item]
+
+    def push(self, key: float, item: int) -> bool:
+        # Returns False when item is already queued with a key no larger than this one
+        position = self.position[item]
+        if position < 0:
+            position = len(self.heap)
+            self.heap.append(item)
+        elif key >= self.keys[item]:
+            return False
+
+        self.keys[item] = key
+        self._sift_up(item, position)
+        return True
+
+    def pop(self) -> Tuple[float, int]:
+        heap, position = self.heap, self.position
+        top = heap[0]
+        last = heap.pop()
+        position[top] = -1
+        if heap:
+            self._sift_down(last, 0)
+        return self.keys[top], top
+
+    def _sift_up(self, item: int, index: int):
+        heap, position, keys = self.heap, self.position, self.keys
+        key = keys[item]
+        while index:
+            parent_index = (index - 1) >> 1
+            parent = heap[parent_index]
+            parent_key = keys[parent]
+            if parent_key < key or (parent_key == key and parent < item):
+                break
+            heap[index] = parent
+            position[parent] = index
+            index = parent_index
+
+        heap[index] = item
+        position[item] = index
+
+    def _sift_down(self, item: int, index: int):
+        heap, position, keys = self.heap, self.position, self.keys
+        key = keys[item]
+        size = len(heap)
+        while True:
+            child_index = 2 * index + 1
+            if child_index >= size:
+                break
+
+            child = heap[child_index]
+            child_key = keys[child]
+            if child_index + 1 < size:
+                sibling = heap[child_index + 1]
+                sibling_key = keys[sibling]
+                if sibling_key < child_key or (sibling_key == child_key and sibling < child):
+                    child_index, child, child_key = child_index + 1, sibling, sibling_key
+
+            if key < child_key or (key == child_key and item < child):
+                break
+            heap[index] = child
+            position[child] = index
+            index = child_index
+
+        heap[index] = item
+        position[item] = index
+
+
+class BucketQueue:
+    # Dial's queue for non negative integer keys where every push lies within max_step of the last popped key,
+    # as in Dijkstra with integer edge costs up to max_step. The max_step + 1 buckets are used circularly, so a
+    # push and a pop are O(1) apart from skipping empty buckets. Pushes are lazy: a lowered key is a second
+    # entry, and the caller skips the outdated one when it is popped. Equal keys pop last in, first out.
+    def __init__(self, max_step: int):
+        if max_step < 0:
+            raise ValueError("max_step must not be negative")
+
+        self.buckets: List[List[int]] = [[] for _ in range(max_step + 1)]
+        self.current_key = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def push(self, key: int, item: int):
+        self.buckets[key % len(self.buckets)].append(item)
+        self.size += 1
+
+    def pop(self) -> Tuple[int, int]:
+        if not self.size:
+            raise IndexError("pop from an empty BucketQueue")
+
+        buckets, num_buckets = self.buckets, len(self.buckets)
+        while not buckets[self.current_key % num_buckets]:
+            self.current_key += 1
+
+        self.size -= 1
+        return self.current_key, buckets[self.current_key % num_buckets].pop()
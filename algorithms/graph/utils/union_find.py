@@ -0,0 +1,40 @@
+from typing import List
+
+
+class UnionFind:
+    # Disjoint sets over ids 0..size-1 with path compression and union by size
+    def __init__(self, size: int = 0):
+        self.parent: List[int] = list(range(size))
+        self.set_size: List[int] = [1] * size
+        self.num_components = size
+
+    def add(self) -> int:
+        new_id = len(self.parent)
+        self.parent.append(new_id)
+        self.set_size.append(1)
+        self.num_components += 1
+        return new_id
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        root = item
+        while parent[root] != root:
+            root = parent[root]
+
+        while parent[item] != root:
+            parent[item], item = root, parent[item]
+
+        return root
+
+    def union(self, first: int, second: int) -> bool:
+        first_root, second_root = self.find(first), self.find(second)
+        if first_root == second_root:
+            return False
+
+        if self.set_size[first_root] < self.set_size[second_root]:
+            first_root, second_root = second_root, first_root
+
+        self.parent[second_root] = first_root
+        self.set_size[first_root] += self.set_size[second_root]
+        self.num_components -= 1
+        return True
@@ -2,6 +2,8 @@ from typing import Callable
 
 import numpy as np
 
+from algorithms.optmization.optimizers import SGD, Adam, Optimizer
+
 
 class OneDimensionalGradientDescent:
     def __init__(self, num_iterations: int, step_size: float):
@@ -9,12 +11,12 @@ class OneDimensionalGradientDescent:
         self.step_size = step_size
 
     def run(self, f_x: Callable, x_init: float):
+        optimizer = SGD(learning_rate=self.step_size)
+        x = np.array(x_init, dtype=np.float64)
         path = [x_init]
         for _ in range(self.num_iterations):
-            x = path[-1]
-            gradient = self._finite_difference(f_x=f_x, x=x)
-            x_next = x - self.step_size * gradient
-            path.append(x_next)
+            optimizer.step(x, self._finite_difference(f_x=f_x, x=x.item()))
+            path.append(x.item())
 
         return path
 
@@ -33,20 +35,14 @@ class OneDimensionalAdaptiveMovementEstimation:
         self.epsilon = epsilon
 
     def run(self, f_x: Callable, x_init: float):
+        optimizer = Adam(learning_rate=self.alpha, first_moment_beta=self.first_moment_beta,
+                         second_moment_beta=self.second_moment_beta, epsilon=self.epsilon,
+                         bias_correction=False, epsilon_inside_sqrt=True)
+        x = np.array(x_init, dtype=np.float64)
         path = [x_init]
-        prev_first_movement = 0
-        prev_second_movement = 0
-
         for _ in range(self.num_iterations):
-            x = path[-1]
-            gradient = self._finite_difference(f_x=f_x, x=x)
-            first_moment = self._first_moment_estimation(prev_first_movement=prev_first_movement, gradient=gradient)
-            second_moment = self._second_moment_estimation(prev_second_movement=prev_second_movement, gradient=gradient)
-            x_next = x - self.alpha * first_moment / np.sqrt(second_moment + self.epsilon)
-
-            prev_first_movement = first_moment
-            prev_second_movement = second_moment
-            path.append(x_next)
+            optimizer.step(x, self._finite_difference(f_x=f_x, x=x.item()))
+            path.append(x.item())
 
         return path
 
@@ -54,8 +50,60 @@ class OneDimensionalAdaptiveMovementEstimation:
     def _finite_difference(f_x: Callable, x: float, delta: float = 1e-5):
         return (f_x(x + delta) - f_x(x)) / delta
 
-    def _first_moment_estimation(self, prev_first_movement: float, gradient: float):
-        return self.first_moment_beta * prev_first_movement + (1 - self.first_moment_beta) * gradient
 
-    def _second_moment_estimation(self, prev_second_movement: float, gradient: float):
-        return self.second_moment_beta * prev_second_movement + (1 - self.second_moment_beta) * np.square(gradient)
+def central_difference_gradient(f_x: Callable, x: np.ndarray, delta: float = 1e-5) -> np.ndarray:
+    # f_x maps (..., dims) arrays to (...) values. All 2 * dims probes of every point go to f_x in one call.
+    dims = x.shape[-1]
+    offsets = delta * np.concatenate([np.eye(dims), -np.eye(dims)])
+    values = f_x(x[..., None, :] + offsets)
+    return (values[..., :dims] - values[..., dims:]) / (2 * delta)
+
+
+class GradientDescent:
+    # N dimensional, batched version of OneDimensionalGradientDescent: x_init is a (dims,) point or a
+    # (batch, dims) array of starting points optimized together. f_x must accept (..., dims) arrays; gradient,
+    # when given, maps (..., dims) to (..., dims) and replaces the central differences. run returns the
+    # (num_iterations + 1, *x_init.shape) path, or only the final x when keep_path is False.
+    def __init__(self, num_iterations: int, step_size: float, keep_path: bool = True):
+        self.num_iterations = num_iterations
+        self.step_size = step_size
+        self.keep_path = keep_path
+
+    def run(self, f_x: Callable, x_init: np.ndarray, gradient: Callable | None = None) -> np.ndarray:
+        return _run_batched(optimizer=SGD(learning_rate=self.step_size), num_iterations=self.num_iterations,
+                            keep_path=self.keep_path, f_x=f_x, x_init=x_init, gradient=gradient)
+
+
+class AdaptiveMovementEstimation:
+    # N dimensional, batched version of OneDimensionalAdaptiveMovementEstimation with the same update rule, run
+    # on the same inputs and outputs as GradientDescent
+    def __init__(self, num_iterations: int, alpha: float, first_moment_beta: float, second_moment_beta: float,
+                 epsilon: float = 1e-5, keep_path: bool = True):
+        self.num_iterations = num_iterations
+        self.alpha = alpha
+        self.first_moment_beta = first_moment_beta
+        self.second_moment_beta = second_moment_beta
+        self.epsilon = epsilon
+        self.keep_path = keep_path
+
+    def run(self, f_x: Callable, x_init: np.ndarray, gradient: Callable | None = None) -> np.ndarray:
+        optimizer = Adam(learning_rate=self.alpha, first_moment_beta=self.first_moment_beta,
+                         second_moment_beta=self.second_moment_beta, epsilon=self.epsilon,
+                         bias_correction=False, epsilon_inside_sqrt=True)
+        return _run_batched(optimizer=optimizer, num_iterations=self.num_iterations, keep_path=self.keep_path,
+                            f_x=f_x, x_init=x_init, gradient=gradient)
+
+
+def _run_batched(optimizer: Optimizer, num_iterations: int, keep_path: bool, f_x: Callable, x_init: np.ndarray,
+                 gradient: Callable | None) -> np.ndarray:
+    x = np.array(x_init, dtype=np.float64)
+    path = np.empty((num_iterations + 1, *x.shape)) if keep_path else None
+    if path is not None:
+        path[0] = x
+
+    for i in range(1, num_iterations + 1):
+        optimizer.step(x, gradient(x) if gradient is not None else central_difference_gradient(f_x=f_x, x=x))
+        if path is not None:
+            path[i] = x
+
+    return path if path is not None else x
@@ -0,0 +1,176 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Iterator, Sequence, Tuple
+
+import numpy as np
+
+
+class BoxConstraint:
+    # Projection onto lower <= params <= upper, in place; either bound may be None, scalars or arrays broadcast
+    def __init__(self, lower: float | np.ndarray | None = None, upper: float | np.ndarray | None = None):
+        self.lower = lower
+        self.upper = upper
+
+    def __call__(self, params: np.ndarray):
+        if self.lower is not None:
+            np.maximum(params, self.lower, out=params)
+        if self.upper is not None:
+            np.minimum(params, self.upper, out=params)
+
+
+class Optimizer(ABC):
+    # Shared step / state interface. step updates params in place from a gradient of the same shape and applies
+    # the optional projection afterwards, which turns any optimizer into its projected variant. State arrays are
+    # allocated on the first step for the params' shape and cleared by reset.
+    def __init__(self, learning_rate: float, constraint: Callable[[np.ndarray], None] | None = None):
+        self.learning_rate = learning_rate
+        self.constraint = constraint
+        self.num_steps = 0
+
+    @abstractmethod
+    def step(self, params: np.ndarray, gradient: np.ndarray) -> np.ndarray:
+        pass
+
+    def reset(self):
+        self.num_steps = 0
+
+    def _begin_step(self, params: np.ndarray):
+        if self.num_steps == 0:
+            self._init_state(params)
+        self.num_steps += 1
+
+    def _project(self, params: np.ndarray) -> np.ndarray:
+        if self.constraint is not None:
+            self.constraint(params)
+        return params
+
+    def _init_state(self, params: np.ndarray):
+        pass
+
+
+class SGD(Optimizer):
+    # velocity = momentum * velocity + gradient, params -= learning_rate * velocity; plain gradient descent
+    # when momentum is 0
+    def __init__(self, learning_rate: float, momentum: float = 0.0,
+                 constraint: Callable[[np.ndarray], None] | None = None):
+        super().__init__(learning_rate=learning_rate, constraint=constraint)
+        self.momentum = momentum
+        self._velocity = None
+
+    def _init_state(self, params: np.ndarray):
+        self._velocity = np.zeros_like(params) if self.momentum else None
+
+    def step(self, params: np.ndarray, gradient: np.ndarray) -> np.ndarray:
+        self._begin_step(params)
+        if self._velocity is not None:
+            self._velocity *= self.momentum
+            self._velocity += gradient
+            gradient = self._velocity
+        params -= self.learning_rate * gradient
+        return self._project(params)
+
+
+class Adam(Optimizer):
+    # With bias_correction=False and epsilon_inside_sqrt=True this is the update of
+    # OneDimensionalAdaptiveMovementEstimation: params -= learning_rate * m / sqrt(v + epsilon)
+    def __init__(self, learning_rate: float, first_moment_beta: float = 0.9, second_moment_beta: float = 0.999,
+                 epsilon: float = 1e-8, bias_correction: bool = True, epsilon_inside_sqrt: bool = False,
+                 constraint: Callable[[np.ndarray], None] | None = None):
+        super().__init__(learning_rate=learning_rate, constraint=constraint)
+        self.first_moment_beta = first_moment_beta
+        self.second_moment_beta = second_moment_beta
+        self.epsilon = epsilon
+        self.bias_correction = bias_correction
+        self.epsilon_inside_sqrt = epsilon_inside_sqrt
+        self._first_moment = self._second_moment = self._buffer = None
+
+    def _init_state(self, params: np.ndarray):
+        self._first_moment = np.zeros_like(params)
+        self._second_moment = np.zeros_like(params)
+        self._buffer = np.empty_like(params)
+
+    def step(self, params: np.ndarray, gradient: np.ndarray) -> np.ndarray:
+        self._begin_step(params)
+        first_moment, second_moment, buffer = self._first_moment, self._second_moment, self._buffer
+
+        first_moment *= self.first_moment_beta
+        first_moment += (1 - self.first_moment_beta) * gradient
+        second_moment *= self.second_moment_beta
+        second_moment += (1 - self.second_moment_beta) * np.square(gradient)
+
+        learning_rate = self.learning_rate
+        if self.bias_correction:
+            learning_rate *= (np.sqrt(1 - self.second_moment_beta ** self.num_steps)
+                              / (1 - self.first_moment_beta ** self.num_steps))
+
+        # buffer holds the denominator, then the step
+        if self.epsilon_inside_sqrt:
+            np.add(second_moment, self.epsilon, out=buffer)
+            np.sqrt(buffer, out=buffer)
+        else:
+            np.sqrt(second_moment, out=buffer)
+            buffer += self.epsilon
+        np.divide(learning_rate * first_moment, buffer, out=buffer)
+        params -= buffer
+        return self._project(params)
+
+
+class RMSProp(Optimizer):
+    # v = decay * v + (1 - decay) * gradient ** 2, params -= learning_rate * gradient / (sqrt(v) + epsilon)
+    def __init__(self, learning_rate: float, decay: float = 0.9, epsilon: float = 1e-8,
+                 constraint: Callable[[np.ndarray], None] | None = None):
+        super().__init__(learning_rate=learning_rate, constraint=constraint)
+        self.decay = decay
+        self.epsilon = epsilon
+        self._mean_square = self._buffer = None
+
+    def _init_state(self, params: np.ndarray):
+        self._mean_square = np.zeros_like(params)
+        self._buffer = np.empty_like(params)
+
+    def step(self, params: np.ndarray, gradient: np.ndarray) -> np.ndarray:
+        self._begin_step(params)
+        mean_square, buffer = self._mean_square, self._buffer
+
+        mean_square *= self.decay
+        mean_square += (1 - self.decay) * np.square(gradient)
+
+        np.sqrt(mean_square, out=buffer)
+        buffer += self.epsilon
+        np.divide(gradient, buffer, out=buffer)
+        buffer *= self.learning_rate
+        params -= buffer
+        return self._project(params)
+
+
+def iterate_minibatches(arrays: Sequence[np.ndarray], batch_size: int, shuffle: bool = True,
+                        rng: np.random.Generator | None = None,
+                        drop_last: bool = False) -> Iterator[Tuple[np.ndarray, ...]]:
+    # One epoch of aligned batches along axis 0. Shuffling permutes the order of contiguous batches rather than
+    # single rows, so memory-mapped arrays (np.load(..., mmap_mode='r')) are still read sequentially; only the
+    # current batch is copied into memory.
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    num_rows = len(arrays[0])
+    if any(len(array) != num_rows for array in arrays):
+        raise ValueError("All arrays must have the same number of rows")
+
+    starts = np.arange(0, num_rows, batch_size)
+    if drop_last and num_rows % batch_size:
+        starts = starts[:-1]
+    if shuffle:
+        starts = (rng if rng is not None else np.random.default_rng()).permutation(starts)
+
+    for start in starts.tolist():
+        yield tuple(np.asarray(array[start:start + batch_size]) for array in arrays)
+
+
+def minimize_stochastic(gradient: Callable[..., np.ndarray], params_init: np.ndarray, arrays: Sequence[np.ndarray],
+                        optimizer: Optimizer, batch_size: int, num_epochs: int, shuffle: bool = True,
+                        seed: int | None = None) -> np.ndarray:
+    # gradient(params, *batch) returns the mini-batch gradient with the params' shape
+    params = np.array(params_init, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+    for _ in range(num_epochs):
+        for batch in iterate_minibatches(arrays=arrays, batch_size=batch_size, shuffle=shuffle, rng=rng):
+            optimizer.step(params, gradient(params, *batch))
+    return params
@@ -0,0 +1,189 @@
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from algorithms.optmization.simulated_annealing import Point, Route
+from algorithms.optmization.vectorized_annealing import augmented_distance_matrix, points_to_coordinates
+
+# Distance matrix rows handed to each pool worker once through the initializer, so a round only ships tours
+_worker_distances: List[List[float]] | None = None
+
+
+def _init_worker(distances: np.ndarray):
+    global _worker_distances
+    _worker_distances = distances.tolist()
+
+
+def _anneal_replica_in_worker(
+        tour: List[int], temperature: float, num_moves: int, two_opt_probability: float,
+        rng: np.random.Generator) -> Tuple[List[int], float, List[int], float, np.random.Generator]:
+    return _anneal_replica(distances=_worker_distances, tour=tour, temperature=temperature, num_moves=num_moves,
+                           two_opt_probability=two_opt_probability, rng=rng)
+
+
+def _anneal_replica(distances: List[List[float]], tour: List[int], temperature: float, num_moves: int,
+                    two_opt_probability: float,
+                    rng: np.random.Generator) -> Tuple[List[int], float, List[int], float, np.random.Generator]:
+    # Metropolis moves at a fixed temperature on a closed tour through the dummy node at position 0. Returns the
+    # final tour, the best tour seen on the way and the advanced generator, so a replica continues its own
+    # random stream whichever process runs it next.
+    num_nodes = len(tour)
+    firsts = rng.integers(1, num_nodes, num_moves).tolist()
+    seconds = rng.integers(1, num_nodes - 1, num_moves).tolist()
+    is_two_opt = (rng.random(num_moves) < two_opt_probability).tolist()
+    thresholds = rng.random(num_moves).tolist()
+
+    tour = list(tour)
+    current_distance = sum(distances[tour[i - 1]][tour[i]] for i in range(num_nodes))
+    best_tour, best_distance = list(tour), current_distance
+
+    for first, second, two_opt, threshold in zip(firsts, seconds, is_two_opt, thresholds):
+        if second >= first:
+            second += 1
+        else:
+            first, second = second, first
+
+        first_prev, first_node, second_node = tour[first - 1], tour[first], tour[second]
+        second_next = tour[(second + 1) % num_nodes]
+        # Both moves replace the edges into first and out of second; a swap of non adjacent positions also
+        # replaces the edges out of first and into second
+        delta = (distances[first_prev][second_node] + distances[first_node][second_next]
+                 - distances[first_prev][first_node] - distances[second_node][second_next])
+        if not two_opt and second - first > 1:
+            first_next, second_prev = tour[first + 1], tour[second - 1]
+            delta += (distances[second_node][first_next] + distances[second_prev][first_node]
+                      - distances[first_node][first_next] - distances[second_prev][second_node])
+
+        if delta >= 0 and math.exp(-delta / temperature) <= threshold:
+            continue
+
+        if two_opt:
+            tour[first:second + 1] = tour[first:second + 1][::-1]
+        else:
+            tour[first], tour[second] = second_node, first_node
+
+        current_distance += delta
+        if current_distance < best_distance:
+            best_distance = current_distance
+            best_tour = list(tour)
+
+    return tour, current_distance, best_tour, best_distance, rng
+
+
+@dataclass
+class TemperingProgress:
+    exchange_round: int
+    elapsed_seconds: float
+    best_distance: float
+    replica_distances: List[float]
+
+
+class ParallelTemperingTSP:
+    # Replica exchange: num_replicas chains at fixed temperatures spaced geometrically between min_temp and
+    # max_temp anneal independently for moves_per_round moves, on a process pool when workers > 1, then
+    # neighbouring temperatures try to swap tours with the usual exp((1 / T_i - 1 / T_j) * (E_i - E_j)) rule.
+    # Each replica and the exchange step draw from their own SeedSequence children, so a seed gives the same
+    # result for any number of workers. The run stops after max_rounds, or once the best distance has not
+    # improved by more than tolerance (relative) for patience rounds.
+    def __init__(self, points: List[Point], num_replicas: int = 8,
+                 min_temp: float = 0.1, max_temp: float = 100,
+                 moves_per_round: int = 2000, max_rounds: int = 200, patience: int = 20, tolerance: float = 1e-4,
+                 two_opt_probability: float = 0.5, workers: int | None = None, seed: int | None = None,
+                 progress_callback: Callable[[TemperingProgress], None] | None = None):
+        if num_replicas < 1 or moves_per_round < 1:
+            raise ValueError("num_replicas and moves_per_round must be at least 1")
+        if max_rounds < 1 or patience < 1:
+            raise ValueError("max_rounds and patience must be at least 1")
+        if not 0 < min_temp <= max_temp:
+            raise ValueError("Temperatures must satisfy 0 < min_temp <= max_temp")
+
+        self.points = points
+        self.temperatures = np.geomspace(min_temp, max_temp, num_replicas).tolist()
+        self.moves_per_round = moves_per_round
+        self.max_rounds = max_rounds
+        self.patience = patience
+        self.tolerance = tolerance
+        self.two_opt_probability = two_opt_probability
+        self.workers = workers
+        self.progress_callback = progress_callback
+
+        seed_sequence = np.random.SeedSequence(seed)
+        exchange_seed, *replica_seeds = seed_sequence.spawn(num_replicas + 1)
+        self.exchange_rng = np.random.default_rng(exchange_seed)
+        self.replica_rngs = [np.random.default_rng(replica_seed) for replica_seed in replica_seeds]
+
+        self.distances = augmented_distance_matrix(points_to_coordinates(points))
+        self.best_distance = None
+
+    def run_simulated_annealing_travel_salesman_problem(self) -> List[Tuple[Point, Point]]:
+        num_points = len(self.points)
+        if num_points < 3:
+            self.best_distance = Route(points=self.points).get_total_distance()
+            return Route(points=self.points).to_edges_list()
+
+        if self.workers is None or self.workers <= 1:
+            best_tour = self._run_rounds(executor=None)
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                     initargs=(self.distances,)) as executor:
+                best_tour = self._run_rounds(executor=executor)
+
+        return Route(points=[self.points[node - 1] for node in best_tour[1:]]).to_edges_list()
+
+    def _run_rounds(self, executor: ProcessPoolExecutor | None) -> List[int]:
+        start_time = time.perf_counter()
+        num_replicas = len(self.temperatures)
+        distances = self.distances.tolist() if executor is None else None
+
+        # tours[k] is the state currently held at temperature k; replica k's generator stays with that slot
+        tours = [list(range(len(self.points) + 1)) for _ in range(num_replicas)]
+        energies = [0.0] * num_replicas
+        best_tour, best_distance = None, float('inf')
+        stale_rounds = 0
+
+        for exchange_round in range(self.max_rounds):
+            if executor is None:
+                results = [_anneal_replica(distances, tour, temperature, self.moves_per_round,
+                                           self.two_opt_probability, rng)
+                           for tour, temperature, rng in zip(tours, self.temperatures, self.replica_rngs)]
+            else:
+                results = list(executor.map(_anneal_replica_in_worker, tours, self.temperatures,
+                                            [self.moves_per_round] * num_replicas,
+                                            [self.two_opt_probability] * num_replicas, self.replica_rngs))
+
+            previous_best = best_distance
+            for k, (tour, energy, replica_best_tour, replica_best, rng) in enumerate(results):
+                tours[k], energies[k], self.replica_rngs[k] = tour, energy, rng
+                if replica_best < best_distance:
+                    best_tour, best_distance = replica_best_tour, replica_best
+
+            self._exchange(tours=tours, energies=energies, exchange_round=exchange_round)
+
+            if self.progress_callback is not None:
+                self.progress_callback(TemperingProgress(exchange_round=exchange_round,
+                                                         elapsed_seconds=time.perf_counter() - start_time,
+                                                         best_distance=best_distance,
+                                                         replica_distances=list(energies)))
+
+            if previous_best - best_distance > self.tolerance * best_distance:
+                stale_rounds = 0
+            else:
+                stale_rounds += 1
+                if stale_rounds >= self.patience:
+                    break
+
+        self.best_distance = float(self.distances[best_tour, np.roll(best_tour, -1)].sum())
+        return best_tour
+
+    def _exchange(self, tours: List[List[int]], energies: List[float], exchange_round: int):
+        # Even rounds try the pairs (0, 1), (2, 3), ..., odd rounds the pairs (1, 2), (3, 4), ...
+        temperatures = self.temperatures
+        for k in range(exchange_round % 2, len(temperatures) - 1, 2):
+            exponent = (1 / temperatures[k] - 1 / temperatures[k + 1]) * (energies[k] - energies[k + 1])
+            if exponent >= 0 or math.exp(exponent) > self.exchange_rng.random():
+                tours[k], tours[k + 1] = tours[k + 1], tours[k]
+                energies[k], energies[k + 1] = energies[k + 1], energies[k]
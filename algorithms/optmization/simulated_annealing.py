@@ -4,6 +4,7 @@ from itertools import pairwise
 from typing import List, Tuple
 
 import numpy as np
+from scipy.spatial import cKDTree
 
 
 @dataclass
@@ -28,10 +29,24 @@ class Route:
                 for curr_point, next_point in pairwise(self.points)]
 
 
+def candidate_neighbor_lists(coordinates: np.ndarray, num_neighbors: int) -> np.ndarray:
+    # The num_neighbors nearest other points of every point, closest first, from a KD-tree
+    num_neighbors = min(num_neighbors, len(coordinates) - 1)
+    if num_neighbors < 1:
+        return np.empty((len(coordinates), 0), dtype=np.int64)
+
+    # With duplicate coordinates a point is not necessarily first in its own row, so it is dropped by value;
+    # a row it is missing from (more than num_neighbors duplicates) drops its farthest entry instead
+    _, neighbors = cKDTree(coordinates).query(coordinates, k=num_neighbors + 1)
+    is_other = neighbors != np.arange(len(coordinates))[:, np.newaxis]
+    is_other[is_other.all(axis=1), -1] = False
+    return neighbors[is_other].reshape(len(coordinates), num_neighbors)
+
+
 class SimulatedAnnealingTSP:
     def __init__(self, points: List[Point],
                  initial_temp: float = 1000, cooling_rate: float = 0.99,
-                 stop_temp: float = 1e-4, max_iter: int = 100000):
+                 stop_temp: float = 1e-4, max_iter: int = 100000, num_candidate_neighbors: int | None = None):
 
         self.current_route = Route(points=points)
         self.initial_temp = initial_temp
@@ -39,11 +54,28 @@ class SimulatedAnnealingTSP:
         self.stop_temp = stop_temp
         self.max_iter = max_iter
 
+        # With candidate neighbors, a proposal is a 2-opt move that puts a point next to one of its nearest
+        # points instead of a uniform random swap
+        self.candidate_neighbors = None
+        if num_candidate_neighbors is not None and len(points) > 2:
+            coordinates = np.array([(point.x, point.y) for point in points], dtype=np.float64)
+            self.candidate_neighbors = [[points[j] for j in row] for row in
+                                        candidate_neighbor_lists(coordinates, num_candidate_neighbors).tolist()]
+            self._point_index = {id(point): i for i, point in enumerate(points)}
+            # _positions[i] is the position of points[i] in the current route, kept up to date on every
+            # accepted move so proposals never scan the route
+            self._positions: List[int] = []
+            self._reversed_segment = (0, 0)
+
     def run_simulated_annealing_travel_salesman_problem(self) -> List[Tuple[Point, Point]]:
         current_route = self.current_route
         best_route = self.current_route
         best_distance = best_route.get_total_distance()
         temp = self.initial_temp
+        if self.candidate_neighbors is not None:
+            self._positions = [0] * len(current_route.points)
+            for position, point in enumerate(current_route.points):
+                self._positions[self._point_index[id(point)]] = position
 
         for _ in range(self.max_iter):
             if temp < self.stop_temp:
@@ -52,6 +84,8 @@ class SimulatedAnnealingTSP:
             new_route: Route = self._suggest_new_route(current_route=current_route)
             if self._should_explore_new_route(current_route=current_route, new_route=new_route, temp=temp):
                 current_route = new_route
+                if self.candidate_neighbors is not None:
+                    self._update_positions(route=new_route)
                 new_route_distance = new_route.get_total_distance()
                 if new_route_distance < best_distance:
                     best_distance = new_route_distance
@@ -75,13 +109,27 @@ class SimulatedAnnealingTSP:
 
         return False
 
-    @staticmethod
-    def _suggest_new_route(current_route: Route) -> Route:
+    def _suggest_new_route(self, current_route: Route) -> Route:
         new_points = current_route.points.copy()
-        i, j = random.sample(range(len(new_points)), 2)
-        new_points[i], new_points[j] = new_points[j], new_points[i]
+        if self.candidate_neighbors is None:
+            i, j = random.sample(range(len(new_points)), 2)
+            new_points[i], new_points[j] = new_points[j], new_points[i]
+            return Route(points=new_points)
+
+        i = random.randrange(len(new_points))
+        neighbor = random.choice(self.candidate_neighbors[self._point_index[id(new_points[i])]])
+        j = self._positions[self._point_index[id(neighbor)]]
+        start, end = (i + 1, j + 1) if i < j else (j, i)
+        new_points[start:end] = new_points[start:end][::-1]
+        self._reversed_segment = (start, end)
         return Route(points=new_points)
 
+    def _update_positions(self, route: Route):
+        # Only the segment reversed by the accepted proposal moved
+        start, end = self._reversed_segment
+        for position in range(start, end):
+            self._positions[self._point_index[id(route.points[position])]] = position
+
 
 if __name__ == "__main__":
     np.random.seed(42)
@@ -0,0 +1,164 @@
+import math
+from collections import deque
+from typing import List, Tuple
+
+from algorithms.optmization.simulated_annealing import Point, Route, candidate_neighbor_lists
+from algorithms.optmization.vectorized_annealing import points_to_coordinates
+
+
+class TSPLocalSearch:
+    # 2-opt and Or-opt (segments of up to max_segment_length points, inserted either way round) restricted to
+    # the num_neighbors nearest points of each endpoint, driven by don't-look bits: a point is only looked at
+    # again after a move changed one of its tour edges. As in the annealing engines, the open route is a closed
+    # tour through a dummy node 0 at distance zero from every point, so moving a route end needs no special case.
+    def __init__(self, points: List[Point], num_neighbors: int = 8, max_segment_length: int = 3):
+        self.points = points
+        self.num_neighbors = num_neighbors
+        self.max_segment_length = max_segment_length
+
+        self.coordinates = points_to_coordinates(points)
+        # Node i + 1 is point i; the dummy node has no neighbor list of its own
+        self.neighbors = [[]] + (candidate_neighbor_lists(self.coordinates, num_neighbors) + 1).tolist()
+        self._xs = [0.0] + self.coordinates[:, 0].tolist()
+        self._ys = [0.0] + self.coordinates[:, 1].tolist()
+        self.best_distance = None
+
+        self._tour: List[int] = []
+        self._position: List[int] = []
+
+    def run_local_search(self, initial_order: List[int] | None = None) -> List[Tuple[Point, Point]]:
+        # initial_order is a permutation of point indices, the input order by default
+        num_points = len(self.points)
+        order = list(range(num_points)) if initial_order is None else list(initial_order)
+        if num_points < 4:
+            route = Route(points=[self.points[i] for i in order])
+            self.best_distance = route.get_total_distance()
+            return route.to_edges_list()
+
+        self._tour = [0] + [i + 1 for i in order]
+        self._position = [0] * len(self._tour)
+        for position, node in enumerate(self._tour):
+            self._position[node] = position
+
+        self._optimize()
+
+        dummy_position = self._position[0]
+        nodes = self._tour[dummy_position + 1:] + self._tour[:dummy_position]
+        route = Route(points=[self.points[node - 1] for node in nodes])
+        self.best_distance = route.get_total_distance()
+        return route.to_edges_list()
+
+    def _optimize(self):
+        queue = deque(self._tour[1:])
+        is_queued = bytearray(len(self._tour))
+        for node in queue:
+            is_queued[node] = 1
+
+        while queue:
+            node = queue.popleft()
+            is_queued[node] = 0
+
+            touched = self._improve_two_opt(node) or self._improve_or_opt(node)
+            if touched:
+                for touched_node in touched:
+                    if not is_queued[touched_node]:
+                        is_queued[touched_node] = 1
+                        queue.append(touched_node)
+
+    def _distance(self, first: int, second: int) -> float:
+        if not first or not second:
+            return 0.0
+        return math.hypot(self._xs[first] - self._xs[second], self._ys[first] - self._ys[second])
+
+    def _succ(self, node: int) -> int:
+        return self._tour[(self._position[node] + 1) % len(self._tour)]
+
+    def _pred(self, node: int) -> int:
+        return self._tour[self._position[node] - 1]
+
+    def _improve_two_opt(self, t1: int) -> Tuple[int, ...]:
+        distance = self._distance
+        for forward in (True, False):
+            t2 = self._succ(t1) if forward else self._pred(t1)
+            removed_first = distance(t1, t2)
+            for t3 in self.neighbors[t1]:
+                added_first = distance(t1, t3)
+                if added_first >= removed_first:
+                    break
+
+                t4 = self._succ(t3) if forward else self._pred(t3)
+                if t3 == t1 or t3 == t2 or t4 == t1:
+                    continue
+
+                if removed_first + distance(t3, t4) - added_first - distance(t2, t4) > 1e-10:
+                    if forward:
+                        self._two_opt_move(t1, t2, t3, t4)
+                    else:
+                        self._two_opt_move(t2, t1, t4, t3)
+                    return t1, t2, t3, t4
+        return ()
+
+    def _improve_or_opt(self, s1: int) -> Tuple[int, ...]:
+        distance = self._distance
+        num_nodes = len(self._tour)
+        for segment_length in range(1, min(self.max_segment_length, num_nodes - 3) + 1):
+            s2 = self._tour[(self._position[s1] + segment_length - 1) % num_nodes]
+            before, after = self._pred(s1), self._succ(s2)
+            segment = {self._tour[(self._position[s1] + i) % num_nodes] for i in range(segment_length)}
+            removal_gain = distance(before, s1) + distance(s2, after) - distance(before, after)
+
+            for end in (s1, s2):
+                for c in self.neighbors[end]:
+                    if distance(end, c) >= removal_gain:
+                        break
+                    if c == end or c in segment:
+                        continue
+
+                    for a, b in ((c, self._succ(c)), (self._pred(c), c)):
+                        if b in segment or a in segment or b == before:
+                            continue
+
+                        forward_cost = distance(a, s1) + distance(s2, b)
+                        reversed_cost = distance(a, s2) + distance(s1, b)
+                        insertion_cost = min(forward_cost, reversed_cost) - distance(a, b)
+                        if removal_gain - insertion_cost > 1e-10:
+                            self._or_opt_move(s1, s2, a, b, keep_orientation=forward_cost <= reversed_cost)
+                            return before, after, a, b, s1, s2
+        return ()
+
+    def _or_opt_move(self, s1: int, s2: int, a: int, b: int, keep_orientation: bool):
+        # Moves the segment s1..s2 (forward order) between a and b = succ(a) as a series of 2-opt moves:
+        # the first two leave ... a s2..s1 b ..., the optional third turns the segment back round
+        before, after = self._pred(s1), self._succ(s2)
+        self._two_opt_move(before, s1, a, b)
+
+        if after != a:
+            if self._succ(before) == a:
+                self._two_opt_move(before, a, after, s2)
+            else:
+                self._two_opt_move(s2, after, a, before)
+
+        if keep_orientation:
+            if self._succ(a) == s2:
+                self._two_opt_move(a, s2, s1, b)
+            else:
+                self._two_opt_move(b, s1, s2, a)
+
+    def _two_opt_move(self, t1: int, t2: int, t3: int, t4: int):
+        # With t2 = succ(t1) and t4 = succ(t3), replaces edges (t1, t2) and (t3, t4) by (t1, t3) and (t2, t4)
+        # by reversing the path t2..t3, or equivalently t4..t1 when that one is shorter
+        tour, position = self._tour, self._position
+        num_nodes = len(tour)
+
+        start, end = position[t2], position[t3]
+        length = (end - start) % num_nodes + 1
+        if 2 * length > num_nodes:
+            start, end = position[t4], position[t1]
+            length = num_nodes - length
+
+        for _ in range(length // 2):
+            first, second = tour[start], tour[end]
+            tour[start], tour[end] = second, first
+            position[second], position[first] = start, end
+            start = start + 1 if start + 1 < num_nodes else 0
+            end = end - 1 if end else num_nodes - 1
@@ -0,0 +1,131 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from algorithms.optmization.simulated_annealing import Point, Route
+
+
+def points_to_coordinates(points: List[Point]) -> np.ndarray:
+    return np.array([(point.x, point.y) for point in points], dtype=np.float64).reshape(-1, 2)
+
+
+def augmented_distance_matrix(coordinates: np.ndarray) -> np.ndarray:
+    # Routes are open paths. Adding a dummy node 0 at distance zero from every point turns a path into a closed
+    # tour through the dummy, so moves never need special cases at the path ends. Point i is node i + 1.
+    num_points = len(coordinates)
+    distances = np.zeros((num_points + 1, num_points + 1), dtype=np.float64)
+    differences = coordinates[:, None, :] - coordinates[None, :, :]
+    distances[1:, 1:] = np.sqrt(np.einsum('ijk,ijk->ij', differences, differences))
+    return distances
+
+
+def tour_lengths(distances: np.ndarray, tours: np.ndarray) -> np.ndarray:
+    return distances[tours, np.roll(tours, -1, axis=-1)].sum(axis=-1)
+
+
+def two_opt_deltas(distances: np.ndarray, tours: np.ndarray, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    # Change in length from reversing tours[:, first..second], first < second, one entry per tour
+    rows = np.arange(len(tours))
+    num_nodes = tours.shape[1]
+    before, start = tours[rows, first - 1], tours[rows, first]
+    end, after = tours[rows, second], tours[rows, (second + 1) % num_nodes]
+    return distances[before, end] + distances[start, after] - distances[before, start] - distances[end, after]
+
+
+def swap_deltas(distances: np.ndarray, tours: np.ndarray, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    # Change in length from exchanging the nodes at positions first < second, one entry per tour
+    rows = np.arange(len(tours))
+    num_nodes = tours.shape[1]
+    first_prev, first_node = tours[rows, first - 1], tours[rows, first]
+    first_next = tours[rows, (first + 1) % num_nodes]
+    second_prev, second_node = tours[rows, second - 1], tours[rows, second]
+    second_next = tours[rows, (second + 1) % num_nodes]
+
+    removed = distances[first_prev, first_node] + distances[second_node, second_next]
+    added = distances[first_prev, second_node] + distances[first_node, second_next]
+
+    # Adjacent positions share the edge between them, which only changes direction
+    apart = second - first > 1
+    removed += np.where(apart, distances[first_node, first_next] + distances[second_prev, second_node], 0)
+    added += np.where(apart, distances[second_node, first_next] + distances[second_prev, first_node], 0)
+    return added - removed
+
+
+class VectorizedSimulatedAnnealingTSP:
+    # Same cooling schedule and acceptance rule as SimulatedAnnealingTSP, run on num_chains independent chains in
+    # lockstep. Tours are rows of an int array over a precomputed distance matrix, each proposal is a 2-opt
+    # reversal or a swap scored in O(1) from the four to eight edges it touches, and only accepted reversals
+    # touch the tour itself. The best tour over all chains is returned.
+    def __init__(self, points: List[Point], num_chains: int = 32,
+                 initial_temp: float = 1000, cooling_rate: float = 0.99,
+                 stop_temp: float = 1e-4, max_iter: int = 100000,
+                 steps_per_temp: int = 1, two_opt_probability: float = 0.5, seed: int | None = None):
+        if num_chains < 1 or steps_per_temp < 1:
+            raise ValueError("num_chains and steps_per_temp must be at least 1")
+
+        self.points = points
+        self.num_chains = num_chains
+        self.initial_temp = initial_temp
+        self.cooling_rate = cooling_rate
+        self.stop_temp = stop_temp
+        self.max_iter = max_iter
+        self.steps_per_temp = steps_per_temp
+        self.two_opt_probability = two_opt_probability
+        self.rng = np.random.default_rng(seed)
+
+        self.distances = augmented_distance_matrix(points_to_coordinates(points))
+        self.best_distance = None
+
+    def run_simulated_annealing_travel_salesman_problem(self) -> List[Tuple[Point, Point]]:
+        num_points = len(self.points)
+        if num_points < 3:
+            self.best_distance = Route(points=self.points).get_total_distance()
+            return Route(points=self.points).to_edges_list()
+
+        distances, rng = self.distances, self.rng
+        rows = np.arange(self.num_chains)
+
+        # The dummy node stays at position 0, moves pick positions in 1..num_points
+        tours = np.tile(np.arange(num_points + 1), (self.num_chains, 1))
+        current_distances = tour_lengths(distances, tours)
+        best_tours, best_distances = tours.copy(), current_distances.copy()
+        temp = self.initial_temp
+
+        for _ in range(self.max_iter):
+            if temp < self.stop_temp:
+                break
+
+            for _ in range(self.steps_per_temp):
+                first = rng.integers(1, num_points + 1, self.num_chains)
+                second = rng.integers(1, num_points, self.num_chains)
+                second += second >= first
+                first, second = np.minimum(first, second), np.maximum(first, second)
+
+                is_two_opt = rng.random(self.num_chains) < self.two_opt_probability
+                deltas = np.where(is_two_opt, two_opt_deltas(distances, tours, first, second),
+                                  swap_deltas(distances, tours, first, second))
+
+                accepted = np.exp(np.minimum(0.0, -deltas / temp)) > rng.random(self.num_chains)
+                accepted |= deltas < 0
+
+                swapped = rows[accepted & ~is_two_opt]
+                tours[swapped, first[swapped]], tours[swapped, second[swapped]] = \
+                    tours[swapped, second[swapped]], tours[swapped, first[swapped]]
+                for chain in rows[accepted & is_two_opt].tolist():
+                    tours[chain, first[chain]:second[chain] + 1] = tours[chain, first[chain]:second[chain] + 1][::-1]
+
+                current_distances += np.where(accepted, deltas, 0.0)
+                improved = current_distances < best_distances
+                if improved.any():
+                    best_tours[improved] = tours[improved]
+                    best_distances[improved] = current_distances[improved]
+
+            temp *= self.cooling_rate
+
+        # Exact lengths, the running totals carry rounding from the accumulated deltas
+        best_distances = tour_lengths(distances, best_tours)
+        best_chain = int(np.argmin(best_distances))
+        self.best_distance = float(best_distances[best_chain])
+
+        best_route = Route(points=[self.points[node - 1] for node in best_tours[best_chain, 1:].tolist()])
+        return best_route.to_edges_list()
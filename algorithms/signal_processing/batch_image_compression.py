@@ -0,0 +1,153 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+import pywt
+import scipy.fft
+from PIL import Image
+
+from algorithms.signal_processing.image_compression import (ImageCompressorMethod, threshold_coefficients,
+                                                            truncate_rfft_spectrum)
+from algorithms.signal_processing.image_quality import psnr, ssim
+
+
+@dataclass
+class RateDistortionPoint:
+    compression_factor: float
+    num_coefficients: int
+    psnr: float
+    ssim: float
+    seconds: float
+
+
+@dataclass
+class ImageSweepResult:
+    name: str
+    shape: Tuple[int, int]
+    method: ImageCompressorMethod
+    transform_seconds: float
+    points: List[RateDistortionPoint]
+    reconstructions: List[np.ndarray] = field(default_factory=list)
+
+
+def sweep_image(image: str | Path | np.ndarray | Image.Image, method: ImageCompressorMethod,
+                compression_factors: Sequence[float], name: str | None = None,
+                keep_reconstructions: bool = False) -> ImageSweepResult:
+    # Loads the image, converts it to grayscale and runs the forward transform once, then thresholds a copy of
+    # the coefficients and inverts it for every compression factor. Reconstructions match
+    # ImageCompressor.run_fft_compression (through the rfft slicing of run_rfft_compression) and
+    # run_wavelet_compression. transform_seconds covers loading and the forward transform, each point's seconds
+    # its thresholding and inverse transform.
+    method = ImageCompressorMethod(method)
+    assert all(0 < compression_factor < 1 for compression_factor in compression_factors), \
+        "compression factor should be greater than 0 or lower than 1"
+
+    start_time = time.perf_counter()
+    if isinstance(image, (str, Path)):
+        name = name if name is not None else Path(image).name
+        image = Image.open(image)
+    if isinstance(image, Image.Image):
+        img_array = np.array(image.convert('L')).astype(np.float64)
+    else:
+        img_array = image.astype(np.float64)
+
+    if method == ImageCompressorMethod.FFT:
+        coeffs = scipy.fft.rfft2(img_array)
+        reconstruct = _reconstruct_fft
+    else:
+        coeffs = pywt.dwt2(img_array, 'db1')
+        reconstruct = _reconstruct_wavelet
+    transform_seconds = time.perf_counter() - start_time
+
+    points, reconstructions = [], []
+    for compression_factor in compression_factors:
+        start_time = time.perf_counter()
+        img_back, num_coefficients = reconstruct(coeffs=coeffs, shape=img_array.shape,
+                                                 compression_factor=compression_factor)
+        seconds = time.perf_counter() - start_time
+
+        points.append(RateDistortionPoint(compression_factor=compression_factor, num_coefficients=num_coefficients,
+                                          psnr=psnr(img_array, img_back), ssim=ssim(img_array, img_back),
+                                          seconds=seconds))
+        if keep_reconstructions:
+            reconstructions.append(img_back)
+
+    return ImageSweepResult(name=name if name is not None else '', shape=img_array.shape, method=method,
+                            transform_seconds=transform_seconds, points=points, reconstructions=reconstructions)
+
+
+def _reconstruct_fft(coeffs: np.ndarray, shape: Tuple[int, int],
+                     compression_factor: float) -> Tuple[np.ndarray, int]:
+    # The rate is the number of full-spectrum coefficients run_fft_compression's mask keeps
+    rows, cols = shape
+    row_keep = int(rows * compression_factor / 2)
+    col_keep = int(cols * compression_factor / 2)
+    if row_keep == 0 or col_keep == 0:
+        return np.zeros(shape), 0
+
+    f_transform = coeffs.copy()
+    truncate_rfft_spectrum(f_transform=f_transform, row_keep=row_keep, col_keep=col_keep)
+    img_back = scipy.fft.irfft2(f_transform, s=shape, overwrite_x=True)
+    return np.clip(img_back, 0, 255, out=img_back), 4 * row_keep * col_keep
+
+
+def _reconstruct_wavelet(coeffs: Tuple[np.ndarray, Tuple[np.ndarray, ...]], shape: Tuple[int, int],
+                         compression_factor: float) -> Tuple[np.ndarray, int]:
+    # The rate is the approximation plus the detail coefficients left non-zero
+    approx, details = coeffs
+    compressed_details = tuple(threshold_coefficients(coeffs=detail.copy(), compression_factor=compression_factor)
+                               for detail in details)
+    img_back = pywt.idwt2((approx, compressed_details), 'db1')
+
+    img_back = np.clip(img_back[:shape[0], :shape[1]], 0, 255)
+    num_coefficients = approx.size + sum(int(np.count_nonzero(detail)) for detail in compressed_details)
+    return img_back, num_coefficients
+
+
+class BatchImageCompressor:
+    # Rate/quality sweep over many images: each image is transformed once by sweep_image and reconstructed at
+    # every compression factor. Images are spread over a process pool when workers > 1; paths are opened in the
+    # workers, so only arrays given directly are shipped to them.
+    def __init__(self, method: ImageCompressorMethod, compression_factors: Sequence[float],
+                 workers: int | None = None, keep_reconstructions: bool = False):
+        if not compression_factors:
+            raise ValueError("compression_factors must not be empty")
+
+        self.method = ImageCompressorMethod(method)
+        self.compression_factors = list(compression_factors)
+        self.workers = workers
+        self.keep_reconstructions = keep_reconstructions
+
+    def run(self, images: str | Path | Iterable[str | Path | np.ndarray | Image.Image]) -> List[ImageSweepResult]:
+        # images is a directory, whose image files are swept in name order, or an iterable of paths and images.
+        # Results keep the input order; images given as arrays are named by their index.
+        if isinstance(images, (str, Path)):
+            extensions = Image.registered_extensions()
+            images = sorted(path for path in Path(images).iterdir() if path.suffix.lower() in extensions)
+        images = list(images)
+        names = [Path(image).name if isinstance(image, (str, Path)) else f'image_{i}'
+                 for i, image in enumerate(images)]
+
+        num_images = len(images)
+        arguments = (images, [self.method] * num_images, [self.compression_factors] * num_images, names,
+                     [self.keep_reconstructions] * num_images)
+        if self.workers is None or self.workers <= 1 or num_images <= 1:
+            return list(map(sweep_image, *arguments))
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(sweep_image, *arguments))
+
+
+def format_rate_distortion_table(results: List[ImageSweepResult]) -> str:
+    lines = [f"{'image':<24} {'method':<8} {'factor':>7} {'coefficients':>12} {'kept':>7} {'psnr':>7} "
+             f"{'ssim':>7} {'ms':>9}"]
+    for result in results:
+        num_pixels = result.shape[0] * result.shape[1]
+        for point in result.points:
+            lines.append(f"{result.name:<24} {result.method:<8} {point.compression_factor:>7.3f} "
+                         f"{point.num_coefficients:>12} {point.num_coefficients / num_pixels:>7.2%} "
+                         f"{point.psnr:>7.2f} {point.ssim:>7.4f} {1000 * point.seconds:>9.2f}")
+    return '\n'.join(lines)
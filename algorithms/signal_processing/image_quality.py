@@ -0,0 +1,25 @@
+import numpy as np
+from scipy.ndimage import gaussian_filter
+
+
+def psnr(reference: np.ndarray, reconstruction: np.ndarray, data_range: float = 255.0) -> float:
+    # Peak signal to noise ratio in dB, inf for identical images
+    mse = np.mean(np.square(np.asarray(reference, dtype=np.float64) - np.asarray(reconstruction, dtype=np.float64)))
+    return float('inf') if mse == 0 else float(10 * np.log10(data_range ** 2 / mse))
+
+
+def ssim(reference: np.ndarray, reconstruction: np.ndarray, data_range: float = 255.0, sigma: float = 1.5) -> float:
+    # Mean structural similarity of two grayscale images (Wang et al. 2004) with a Gaussian window of width sigma
+    # and the usual constants K1 = 0.01, K2 = 0.03; 1 for identical images
+    x = np.asarray(reference, dtype=np.float64)
+    y = np.asarray(reconstruction, dtype=np.float64)
+    c1, c2 = (0.01 * data_range) ** 2, (0.03 * data_range) ** 2
+
+    mu_x, mu_y = gaussian_filter(x, sigma), gaussian_filter(y, sigma)
+    var_x = gaussian_filter(x * x, sigma) - mu_x * mu_x
+    var_y = gaussian_filter(y * y, sigma) - mu_y * mu_y
+    covariance = gaussian_filter(x * y, sigma) - mu_x * mu_y
+
+    ssim_map = ((2 * mu_x * mu_y + c1) * (2 * covariance + c2)
+                / ((mu_x * mu_x + mu_y * mu_y + c1) * (var_x + var_y + c2)))
+    return float(ssim_map.mean())
@@ -0,0 +1,110 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+from PIL import Image
+
+from algorithms.signal_processing.image_compression import ImageCompressor, ImageCompressorMethod
+
+
+def _compress_tile(tile: np.ndarray, method: ImageCompressorMethod, compression_factor: float) -> np.ndarray:
+    if tile.ndim == 3:
+        # Same grayscale conversion ImageCompressor applies to whole PIL images
+        tile = np.array(Image.fromarray(np.ascontiguousarray(tile)).convert('L'))
+
+    compressor = ImageCompressor(image=tile)
+    if method == ImageCompressorMethod.FFT:
+        return compressor.run_fft_compression(compression_factor=compression_factor)
+    return compressor.run_wavelet_compression(compression_factor=compression_factor)
+
+
+class TiledImageCompressor:
+    # JPEG-style block compression: the image is cut into tile_size x tile_size blocks that are compressed
+    # independently by ImageCompressor, tiles_in_flight at a time, and written into the output as they finish.
+    # A remainder strip narrower than tile_size is folded into the last tile of its row or column, so edge
+    # tiles are between tile_size and 2 * tile_size - 1 wide rather than a few pixels.
+    # Memory stays around tiles_in_flight tiles when the image is a memory-mapped array or a .npy file (opened
+    # with mmap_mode='r') and the output goes to a .npy file. Other image files are opened with PIL, which
+    # decodes them in full on first access.
+    def __init__(self, image: str | Path | np.ndarray | Image.Image, tile_size: int = 256, workers: int | None = None,
+                 tiles_in_flight: int | None = None):
+        if tile_size < 2:
+            raise ValueError("tile_size must be at least 2")
+
+        if isinstance(image, (str, Path)):
+            image = np.load(image, mmap_mode='r') if Path(image).suffix == '.npy' else Image.open(image)
+        self.image = image
+
+        if isinstance(image, Image.Image):
+            self.cols, self.rows = image.size
+        else:
+            self.rows, self.cols = image.shape[:2]
+
+        self.tile_size = tile_size
+        self.workers = workers
+        self.tiles_in_flight = tiles_in_flight if tiles_in_flight is not None else 2 * (workers or 1)
+
+    def run(self, method: ImageCompressorMethod, compression_factor: float,
+            output_path: str | Path | None = None) -> np.ndarray:
+        # Returns the float32 grayscale reconstruction, as an open .npy memmap when output_path is given
+        assert 0 < compression_factor < 1, "compression factor should be greater than 0 or lower than 1"
+        method = ImageCompressorMethod(method)
+        if method == ImageCompressorMethod.FFT:
+            # The FFT keeps int(side * compression_factor / 2) frequencies per axis, none at all for too small tiles
+            smallest_side = min(self.tile_size, self.rows, self.cols)
+            if int(smallest_side * compression_factor / 2) == 0:
+                raise ValueError(f"A {smallest_side} pixel tile side keeps no frequencies at compression factor "
+                                 f"{compression_factor}; use a larger tile_size or compression_factor")
+
+        if output_path is None:
+            output = np.empty((self.rows, self.cols), dtype=np.float32)
+        else:
+            output = np.lib.format.open_memmap(output_path, mode='w+', dtype=np.float32, shape=(self.rows, self.cols))
+
+        if self.workers is None or self.workers <= 1:
+            for (top, left), tile in self._iter_tiles():
+                compressed = _compress_tile(tile=tile, method=method, compression_factor=compression_factor)
+                output[top:top + compressed.shape[0], left:left + compressed.shape[1]] = compressed
+        else:
+            self._run_parallel(output=output, method=method, compression_factor=compression_factor)
+
+        if isinstance(output, np.memmap):
+            output.flush()
+        return output
+
+    def _run_parallel(self, output: np.ndarray, method: ImageCompressorMethod, compression_factor: float):
+        # Tiles are submitted only while fewer than tiles_in_flight are pending, so reading never runs ahead of
+        # the workers by more than that many tiles
+        pending: Dict[Future, Tuple[int, int]] = {}
+        tiles = self._iter_tiles()
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            while True:
+                for corner, tile in tiles:
+                    pending[executor.submit(_compress_tile, tile, method, compression_factor)] = corner
+                    if len(pending) >= self.tiles_in_flight:
+                        break
+
+                if not pending:
+                    return
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    top, left = pending.pop(future)
+                    compressed = future.result()
+                    output[top:top + compressed.shape[0], left:left + compressed.shape[1]] = compressed
+
+    def _tile_bounds(self, length: int) -> List[Tuple[int, int]]:
+        starts = list(range(0, length, self.tile_size))
+        if len(starts) > 1 and length - starts[-1] < self.tile_size:
+            starts.pop()
+        return list(zip(starts, starts[1:] + [length]))
+
+    def _iter_tiles(self) -> Iterator[Tuple[Tuple[int, int], np.ndarray]]:
+        for top, bottom in self._tile_bounds(self.rows):
+            for left, right in self._tile_bounds(self.cols):
+                if isinstance(self.image, Image.Image):
+                    tile = np.array(self.image.crop((left, top, right, bottom)).convert('L'))
+                else:
+                    tile = np.asarray(self.image[top:bottom, left:right])
+                yield (top, left), tile
@@ -0,0 +1,165 @@
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+import pywt
+from PIL import Image
+
+from algorithms.signal_processing.image_quality import psnr
+
+# File layout: FILE_HEADER, the wavelet and mode names, then the zlib compressed position deltas and the zlib
+# compressed quantized values. Positions index the flattened coefficients: the approximation first, then the
+# (horizontal, vertical, diagonal) details from the coarsest level to the finest, each raveled in C order.
+FILE_MAGIC = b'LNBW'
+FILE_VERSION = 1
+FILE_HEADER = struct.Struct('<4sBIIBBBdQ2s2sQQ')
+
+
+@dataclass
+class CompressedWaveletImage:
+    shape: Tuple[int, int]
+    wavelet: str
+    mode: str
+    level: int
+    quantization_step: float
+    position_deltas: np.ndarray
+    values: np.ndarray
+
+    @property
+    def num_coefficients(self) -> int:
+        return len(self.values)
+
+    @property
+    def num_bytes(self) -> int:
+        return len(self.to_bytes())
+
+    def to_bytes(self) -> bytes:
+        wavelet, mode = self.wavelet.encode(), self.mode.encode()
+        positions = zlib.compress(self.position_deltas.tobytes())
+        values = zlib.compress(self.values.tobytes())
+        header = FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, self.shape[0], self.shape[1], self.level,
+                                  len(wavelet), len(mode), self.quantization_step, self.num_coefficients,
+                                  self.position_deltas.dtype.str[1:].encode(), self.values.dtype.str[1:].encode(),
+                                  len(positions), len(values))
+        return header + wavelet + mode + positions + values
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'CompressedWaveletImage':
+        (magic, version, rows, cols, level, wavelet_length, mode_length, quantization_step, num_coefficients,
+         position_dtype, value_dtype, positions_length, values_length) = FILE_HEADER.unpack_from(data)
+        if magic != FILE_MAGIC or version != FILE_VERSION:
+            raise ValueError("Not a compressed wavelet image, or written by an unsupported version")
+
+        offset = FILE_HEADER.size
+        wavelet = data[offset:offset + wavelet_length].decode()
+        offset += wavelet_length
+        mode = data[offset:offset + mode_length].decode()
+        offset += mode_length
+        position_deltas = np.frombuffer(zlib.decompress(data[offset:offset + positions_length]),
+                                        dtype='<' + position_dtype.decode())
+        offset += positions_length
+        values = np.frombuffer(zlib.decompress(data[offset:offset + values_length]), dtype='<' + value_dtype.decode())
+
+        if len(values) != num_coefficients or len(position_deltas) != num_coefficients:
+            raise ValueError("Corrupted compressed wavelet image")
+        return cls(shape=(rows, cols), wavelet=wavelet, mode=mode, level=level, quantization_step=quantization_step,
+                   position_deltas=position_deltas, values=values)
+
+
+def write_compressed_wavelet(compressed: CompressedWaveletImage, path: str | Path) -> int:
+    data = compressed.to_bytes()
+    Path(path).write_bytes(data)
+    return len(data)
+
+
+def read_compressed_wavelet(path: str | Path) -> CompressedWaveletImage:
+    return CompressedWaveletImage.from_bytes(Path(path).read_bytes())
+
+
+@dataclass
+class WaveletCompressionReport:
+    psnr: float
+    num_bytes: int
+    num_coefficients: int
+    compression_ratio: float
+
+
+class WaveletCodec:
+    # Multi-level wavedec2 codec. compression_factor is the share of all coefficients kept: the largest ones in
+    # magnitude, found with a partial sort (np.argpartition) over the whole decomposition rather than one
+    # percentile per subband. Kept values are rounded to multiples of quantization_step, in pixel units for
+    # orthogonal wavelets, and stored with their sorted positions as deltas, each in the smallest integer
+    # dtype that fits.
+    def __init__(self, wavelet: str = 'db1', level: int | None = None, mode: str = 'symmetric',
+                 quantization_step: float = 1.0):
+        if quantization_step <= 0:
+            raise ValueError("quantization_step must be positive")
+
+        self.wavelet = wavelet
+        self.level = level
+        self.mode = mode
+        self.quantization_step = quantization_step
+
+    def encode(self, image: Image.Image | np.ndarray, compression_factor: float) -> CompressedWaveletImage:
+        assert 0 < compression_factor < 1, "compression factor should be greater than 0 or lower than 1"
+        img_array = _to_grayscale(image)
+
+        level = self.level if self.level is not None else pywt.dwtn_max_level(img_array.shape, self.wavelet)
+        coeffs = pywt.wavedec2(img_array, self.wavelet, mode=self.mode, level=level)
+        flat = np.concatenate([coeffs[0].ravel()] + [band.ravel() for details in coeffs[1:] for band in details])
+
+        num_kept = max(1, int(len(flat) * compression_factor))
+        positions = np.sort(np.argpartition(np.abs(flat), len(flat) - num_kept)[len(flat) - num_kept:])
+        kept = flat[positions]
+
+        values = np.rint(kept / self.quantization_step).astype(np.int64)
+        value_dtype = np.promote_types(np.min_scalar_type(-int(np.abs(values).max()) - 1), np.int8)
+
+        position_deltas = np.diff(positions, prepend=0)
+        position_dtype = np.min_scalar_type(int(position_deltas.max()))
+        return CompressedWaveletImage(shape=img_array.shape, wavelet=self.wavelet, mode=self.mode, level=level,
+                                      quantization_step=self.quantization_step,
+                                      position_deltas=position_deltas.astype(position_dtype),
+                                      values=values.astype(value_dtype))
+
+    @staticmethod
+    def decode(compressed: CompressedWaveletImage) -> np.ndarray:
+        shapes = pywt.wavedecn_shapes(compressed.shape, compressed.wavelet, mode=compressed.mode,
+                                      level=compressed.level)
+        sizes = [int(np.prod(shapes[0]))] + [int(np.prod(detail_shapes['dd'])) for detail_shapes in shapes[1:]
+                                            for _ in range(3)]
+
+        flat = np.zeros(sum(sizes))
+        flat[np.cumsum(compressed.position_deltas, dtype=np.int64)] = compressed.values * compressed.quantization_step
+
+        bands: List[np.ndarray] = np.split(flat, np.cumsum(sizes)[:-1])
+        coeffs = [bands[0].reshape(shapes[0])]
+        for i, detail_shapes in enumerate(shapes[1:]):
+            horizontal, vertical, diagonal = bands[1 + 3 * i:4 + 3 * i]
+            coeffs.append((horizontal.reshape(detail_shapes['da']), vertical.reshape(detail_shapes['ad']),
+                           diagonal.reshape(detail_shapes['dd'])))
+
+        img_back = pywt.waverec2(coeffs, compressed.wavelet, mode=compressed.mode)
+        img_back = img_back[:compressed.shape[0], :compressed.shape[1]]
+        return np.clip(img_back, 0, 255)
+
+    def run(self, image: Image.Image | np.ndarray,
+            compression_factor: float) -> Tuple[np.ndarray, CompressedWaveletImage, WaveletCompressionReport]:
+        img_array = _to_grayscale(image)
+        compressed = self.encode(image=img_array, compression_factor=compression_factor)
+        img_back = self.decode(compressed)
+
+        num_bytes = compressed.num_bytes
+        report = WaveletCompressionReport(psnr=psnr(img_array, img_back), num_bytes=num_bytes,
+                                          num_coefficients=compressed.num_coefficients,
+                                          compression_ratio=img_array.size / num_bytes)
+        return img_back, compressed, report
+
+
+def _to_grayscale(image: Image.Image | np.ndarray) -> np.ndarray:
+    if isinstance(image, Image.Image):
+        return np.array(image.convert('L')).astype(np.float64)
+    return image.astype(np.float64)
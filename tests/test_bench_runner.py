@@ -0,0 +1,11 @@
+import pytest
+
+from algorithms.bench.__main__ import main
+from algorithms.bench.runner import run_benchmark
+
+
+def test_repeat_must_be_positive():
+    with pytest.raises(ValueError):
+        run_benchmark('bfs', size=100, repeat=0)
+    with pytest.raises(SystemExit):
+        main(['run', '--repeat', '0'])
@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from algorithms.graph.shortest_path.a_star import AStar
+from algorithms.graph.shortest_path.bidirectional import BidirectionalAStar, BidirectionalDijkstra
+from algorithms.graph.shortest_path.dijkstra import Dijkstra
+from algorithms.graph.shortest_path.hierarchical_a_star import HierarchicalAStar
+from algorithms.graph.shortest_path.jump_point_search import JumpPointSearch
+from algorithms.graph.utils import GridCellType
+
+MAZE_SEEDS = range(40)
+
+
+def random_maze(height, width, seed, weights=(6, 2, 2)):
+    rng = random.Random(seed)
+    cell_types = [GridCellType.OPEN_PATH, GridCellType.BLOCK, GridCellType.OBSTACLE]
+    maze = [rng.choices(cell_types, weights, k=width) for _ in range(height)]
+    start, goal = rng.sample(range(height * width), 2)
+    maze[start // width][start % width] = GridCellType.START
+    maze[goal // width][goal % width] = GridCellType.END
+    return maze
+
+
+@pytest.mark.parametrize('algorithm', [AStar, JumpPointSearch, BidirectionalDijkstra, BidirectionalAStar])
+@pytest.mark.parametrize('seed', MAZE_SEEDS)
+def test_distance_matches_dijkstra(algorithm, seed):
+    maze = random_maze(12, 15, seed)
+    assert algorithm(maze).run()[0] == Dijkstra(maze).run()[0]
+
+
+@pytest.mark.parametrize('seed', MAZE_SEEDS)
+def test_hierarchical_a_star_is_near_optimal(seed):
+    # HPA* paths go through cluster entrances, so they are never shorter than Dijkstra's and exist exactly when
+    # the goal is reachable
+    maze = random_maze(24, 30, seed)
+    distance = HierarchicalAStar(maze, cluster_size=6).run()[0]
+    dijkstra_distance = Dijkstra(maze).run()[0]
+    assert (distance == -1) == (dijkstra_distance == -1)
+    assert distance >= dijkstra_distance
@@ -0,0 +1,8 @@
+from algorithms.graph.utils import GridCellType, grid_to_graph
+
+
+def test_falsy_cells_are_sources():
+    g = grid_to_graph([[GridCellType.BLOCK, None, GridCellType.START, None]])
+    assert g.number_of_nodes() == 4
+    assert g.number_of_edges() == 3
+    assert not g.has_edge((0, 1), (0, 3))
@@ -0,0 +1,50 @@
+import pytest
+
+from algorithms.graph.shortest_path.dijkstra import Dijkstra
+from algorithms.graph.shortest_path.lifelong_planning_a_star import LifelongPlanningAStar
+from algorithms.graph.utils import GridCellType
+from algorithms.graph.utils.history import HistoryLogger, HistoryMode
+
+S, E, O = GridCellType.START, GridCellType.END, GridCellType.OPEN_PATH
+
+
+def make_maze():
+    return [[S, O, O, O, E],
+            [O, O, O, O, O],
+            [O, O, O, O, O]]
+
+
+def test_update_cells_matches_dijkstra():
+    maze = make_maze()
+    planner = LifelongPlanningAStar(maze)
+    assert planner.run()[0] == Dijkstra(maze).run()[0]
+
+    maze[0][2] = GridCellType.BLOCK
+    planner.update_cells([(0, 2, GridCellType.BLOCK)])
+    assert planner.run()[0] == Dijkstra(maze).run()[0]
+
+
+def test_rejected_batch_leaves_planner_unchanged():
+    maze = make_maze()
+    planner = LifelongPlanningAStar(maze)
+    distance, _ = planner.run()
+
+    with pytest.raises(ValueError):
+        planner.update_cells([(0, 2, GridCellType.BLOCK), (0, 0, GridCellType.OBSTACLE)])
+
+    assert planner.grid.costs[planner.grid.to_index(0, 2)] == 1
+    assert planner.run()[0] == distance == Dijkstra(make_maze()).run()[0]
+
+
+@pytest.mark.parametrize('mode', [HistoryMode.FULL, HistoryMode.COMPACT])
+def test_runs_record_into_the_callers_history(mode):
+    history = HistoryLogger(mode=mode)
+    planner = LifelongPlanningAStar(make_maze(), history=history)
+    _, returned = planner.run()
+    assert returned is history
+    assert history.step > 0
+    assert history.history_dict[0] == (0, 0)
+
+    planner.update_cells([(0, 2, GridCellType.BLOCK)])
+    planner.run()
+    assert len(history.history_dict) == history.step
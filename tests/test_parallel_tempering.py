@@ -0,0 +1,23 @@
+import random
+
+import pytest
+
+from algorithms.optmization.parallel_tempering import ParallelTemperingTSP
+from algorithms.optmization.simulated_annealing import Point
+
+
+def make_points(num_points=12, seed=0):
+    rng = random.Random(seed)
+    return [Point(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(num_points)]
+
+
+@pytest.mark.parametrize('options', [{'max_rounds': 0}, {'patience': 0}])
+def test_rounds_must_be_positive(options):
+    with pytest.raises(ValueError):
+        ParallelTemperingTSP(make_points(), **options)
+
+
+def test_single_round():
+    tempering = ParallelTemperingTSP(make_points(), num_replicas=3, moves_per_round=100, max_rounds=1, seed=1)
+    assert len(tempering.run_simulated_annealing_travel_salesman_problem()) == 11
+    assert tempering.best_distance > 0
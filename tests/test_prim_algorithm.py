@@ -0,0 +1,16 @@
+from algorithms.graph.minimum_spanning_tree.prim_algorithm import PrimAlgorithm
+from algorithms.graph.utils import GridCellType, edge_list_to_graph, grid_to_graph
+
+
+def test_integer_weights_are_kept():
+    mst_edges, _ = PrimAlgorithm(edge_list_to_graph([(0, 1, 3), (1, 2, 5)])).run()
+    assert mst_edges == [(0, 1, 3), (1, 2, 5)]
+    assert all(type(weight) is int for _, _, weight in mst_edges)
+
+
+def test_grid_graph_with_cell_type_weights():
+    grid = [[GridCellType.START, GridCellType.OPEN_PATH],
+            [GridCellType.OBSTACLE, GridCellType.END]]
+    mst_edges, _ = PrimAlgorithm(grid_to_graph(grid)).run()
+    assert len(mst_edges) == 3
+    assert all(isinstance(weight, GridCellType) for _, _, weight in mst_edges)
@@ -0,0 +1,18 @@
+import pytest
+
+from algorithms.graph.shortest_path.query import UNREACHABLE, ShortestPathQuery
+from algorithms.graph.utils import GridCellType
+
+O, B = GridCellType.OPEN_PATH, GridCellType.BLOCK
+
+
+def test_block_start_point_is_rejected():
+    query = ShortestPathQuery([[O, B, O]])
+    with pytest.raises(ValueError):
+        query.run((0, 1), (0, 2))
+    with pytest.raises(ValueError):
+        query.get_distance_field((0, 1))
+
+
+def test_block_goal_point_is_unreachable():
+    assert ShortestPathQuery([[O, B, O]]).run((0, 0), (0, 1)) == UNREACHABLE
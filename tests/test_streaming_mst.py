@@ -0,0 +1,15 @@
+import numpy as np
+import pytest
+
+from algorithms.graph.minimum_spanning_tree.streaming_mst import EDGE_RECORD_DTYPE, StreamingMST
+
+
+def test_sparse_large_node_ids():
+    forest = StreamingMST().run(np.array([(0, 10 ** 10, 1.0)], dtype=EDGE_RECORD_DTYPE))
+    assert forest.num_nodes == 2
+    assert forest.num_components == 1
+
+
+def test_negative_node_ids_are_rejected():
+    with pytest.raises(ValueError):
+        StreamingMST().run(np.array([(-1, 2, 1.0), (2, 3, 1.0)], dtype=EDGE_RECORD_DTYPE))
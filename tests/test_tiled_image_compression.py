@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from algorithms.signal_processing.image_compression import ImageCompressorMethod
+from algorithms.signal_processing.tiled_image_compression import TiledImageCompressor
+
+
+def make_image(rows: int, cols: int) -> np.ndarray:
+    y, x = np.mgrid[:rows, :cols]
+    return (128 + 60 * np.sin(x / 7) * np.cos(y / 5)).astype(np.uint8)
+
+
+@pytest.mark.parametrize('method', list(ImageCompressorMethod))
+def test_non_divisible_dimensions_keep_edge_strips(method):
+    image = make_image(130, 97)
+    output = TiledImageCompressor(image=image, tile_size=32).run(method=method, compression_factor=0.5)
+
+    assert output.shape == image.shape
+    assert np.abs(output.mean(axis=0) - image.mean(axis=0)).max() < 10
+    assert np.abs(output.mean(axis=1) - image.mean(axis=1)).max() < 10
+
+
+def test_fft_rejects_tiles_that_would_keep_no_frequency():
+    with pytest.raises(ValueError):
+        TiledImageCompressor(image=make_image(40, 40), tile_size=8).run(method=ImageCompressorMethod.FFT,
+                                                                        compression_factor=0.2)